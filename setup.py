@@ -5,7 +5,12 @@ setup(
     name="yolo-mode",
     version="0.1.0",
     packages=find_packages(),
-    install_requires=[],
+    # PyYAML wheels bundle the libyaml C extension used for fast config parsing
+    install_requires=["PyYAML"],
+    extras_require={
+        # pytest -n auto -m "not slow" for the fast tier, -m slow for the rest
+        "tests": ["pytest", "pytest-xdist"],
+    },
     entry_points={
         "console_scripts": [
             "yolo-mode=yolo_mode.scripts.yolo_loop:main",
@@ -0,0 +1,236 @@
+"""
+Tests for Agent Configuration
+
+Tests loading, caching, and persistence of .claude-agents/config.yml.
+"""
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from yolo_mode.agents import config as agent_config
+from yolo_mode.agents.config import AgentConfigManager
+from yolo_mode.agents.registry import AgentCapability, OSARole
+
+
+SAMPLE_CONFIG = """version: "1.0"
+default_agent: qwen
+agent_overrides:
+  crush:
+    agent_id: crush
+    enabled: false
+global_settings:
+  show_resource_usage: true
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """A config file with one disabled built-in agent."""
+    path = tmp_path / "config.yml"
+    path.write_text(SAMPLE_CONFIG)
+    return path
+
+
+# ============================================================================
+# LOADING TESTS
+# ============================================================================
+
+class TestConfigLoading:
+    """Test reading the config file."""
+
+    def test_loads_overrides_and_settings(self, config_file):
+        """Values from the file should be reflected in the loaded config."""
+        manager = AgentConfigManager(str(config_file))
+
+        assert manager.get_default_agent() == "qwen"
+        assert manager.config.agent_overrides["crush"].enabled is False
+        assert manager.get_global_setting("show_resource_usage") is True
+
+    def test_agent_ids_interned(self, config_file):
+        """Agent ids from the file are the same objects as the registry keys."""
+        manager = AgentConfigManager(str(config_file))
+
+        registry_keys = {k: k for k in agent_config.AGENT_REGISTRY}
+        override_key = next(iter(manager.config.agent_overrides))
+        assert override_key is registry_keys["crush"]
+        assert manager.get_default_agent() is registry_keys["qwen"]
+
+    def test_unchanged_file_parsed_once(self, config_file):
+        """A second manager for the same unchanged file reuses the first parse."""
+        with patch.object(agent_config.yaml, "load", wraps=agent_config.yaml.load) as parse:
+            AgentConfigManager(str(config_file))
+            AgentConfigManager(str(config_file))
+        assert parse.call_count == 1
+
+    def test_changed_file_is_reparsed(self, config_file):
+        """Editing the file invalidates the cached parse."""
+        AgentConfigManager(str(config_file))
+        config_file.write_text(SAMPLE_CONFIG.replace("default_agent: qwen", "default_agent: gemini"))
+
+        assert AgentConfigManager(str(config_file)).get_default_agent() == "gemini"
+
+    def test_managers_do_not_share_mutable_state(self, config_file):
+        """Changing one manager's in-memory settings must not leak into the cache."""
+        first = AgentConfigManager(str(config_file))
+        first.config.global_settings["show_resource_usage"] = False
+
+        second = AgentConfigManager(str(config_file))
+        assert second.get_global_setting("show_resource_usage") is True
+
+
+# ============================================================================
+# AGENT LIST TESTS
+# ============================================================================
+
+class TestAvailableAgents:
+    """Test the enabled-agent list and its invalidation."""
+
+    def test_disabled_agent_excluded(self, config_file):
+        """An override with enabled: false hides the built-in agent."""
+        agents = AgentConfigManager(str(config_file)).get_all_available_agents()
+
+        assert "crush" not in agents
+        assert "qwen" in agents
+
+    def test_list_follows_agent_changes(self, config_file):
+        """Adding and removing agents is reflected in the next call."""
+        manager = AgentConfigManager(str(config_file))
+        manager.get_all_available_agents().append("bogus")
+        assert "bogus" not in manager.get_all_available_agents()
+
+        manager.add_custom_agent(agent_config.CustomAgent(
+            name="aider", description="Pair programmer", cli_command="aider"
+        ))
+        assert manager.get_all_available_agents()[-1] == "aider"
+        assert manager.set_default_agent("aider")
+
+        manager.remove_agent("crush")
+        assert "crush" in manager.get_all_available_agents()
+
+    def test_agent_config_resolved_once_until_changed(self, config_file):
+        """Merged configs are reused, and rebuilt after the agent set changes."""
+        manager = AgentConfigManager(str(config_file))
+        assert manager.get_agent_config("qwen") is manager.get_agent_config("qwen")
+        assert manager.get_agent_config("aider") is None
+
+        manager.add_custom_agent(agent_config.CustomAgent(
+            name="aider", description="Pair programmer", cli_command="aider"
+        ))
+        assert manager.get_agent_config("aider").cli_command == "aider"
+
+    def test_custom_agent_roles_converted_to_enum_sets(self, config_file):
+        """Custom agents expose roles and capabilities like built-in registry entries."""
+        manager = AgentConfigManager(str(config_file))
+        manager.add_custom_agent(agent_config.CustomAgent(
+            name="aider", description="Pair programmer", cli_command="aider",
+            osa_roles=["coder", "qa"], capabilities=["testing"]
+        ))
+
+        config = manager.get_agent_config("aider")
+        assert config.osa_roles == {OSARole.CODER, OSARole.QA}
+        assert config.capabilities == {AgentCapability.TESTING}
+
+    def test_custom_agent_with_unknown_role_skipped(self, config_file, capsys):
+        """A custom agent naming an unknown role is skipped; the others still resolve."""
+        manager = AgentConfigManager(str(config_file))
+        manager.add_custom_agent(agent_config.CustomAgent(
+            name="aider", description="Pair programmer", cli_command="aider",
+            osa_roles=["wizard"]
+        ))
+
+        assert "Skipping custom agent 'aider'" in capsys.readouterr().out
+        assert manager.get_agent_config("aider") is None
+        assert manager.get_agent_config("qwen").cli_command == "qwen"
+
+    def test_invalid_custom_agent_keeps_shadowed_builtin(self, config_file, capsys):
+        """A broken custom agent reusing a built-in id leaves the built-in in place."""
+        manager = AgentConfigManager(str(config_file))
+        manager.add_custom_agent(agent_config.CustomAgent(
+            name="qwen", description="Local fork", cli_command="qwen-fork",
+            osa_roles=["wizard"]
+        ))
+        assert "Skipping custom agent 'qwen'" in capsys.readouterr().out
+        assert manager.get_agent_config("qwen").cli_command == "qwen"
+
+        # Later managers for the same file don't repeat the warning
+        assert AgentConfigManager(str(config_file)).get_agent_config("qwen").cli_command == "qwen"
+        assert "Skipping" not in capsys.readouterr().out
+
+
+# ============================================================================
+# PERSISTENCE TESTS
+# ============================================================================
+
+class TestConfigSaving:
+    """Test writing the config file back."""
+
+    def test_saved_config_round_trips(self, config_file):
+        """Overrides and custom agents written by the manager load back intact."""
+        manager = AgentConfigManager(str(config_file))
+        manager.add_custom_agent(agent_config.CustomAgent(
+            name="aider", description="Pair programmer", cli_command="aider", osa_roles=["coder"]
+        ))
+
+        reloaded = AgentConfigManager(str(config_file))
+        assert "!!python" not in config_file.read_text()
+        assert reloaded.config.agent_overrides["crush"].enabled is False
+        assert reloaded.config.custom_agents["aider"].osa_roles == ["coder"]
+
+    def test_failed_save_leaves_file_intact(self, config_file):
+        """An error while writing the new content keeps the old file and no temp files."""
+        manager = AgentConfigManager(str(config_file))
+        with patch.object(manager, "_dump_config", return_value="version: '2.0'\n"), \
+                patch.object(agent_config.os, "replace", side_effect=OSError("disk full")):
+            assert manager._save_config() is False
+
+        assert config_file.read_text() == SAMPLE_CONFIG
+        assert [p.name for p in config_file.parent.iterdir()] == ["config.yml"]
+
+    def test_save_keeps_file_permissions(self, config_file):
+        """Replacing the file does not reset its mode to the temp file's 0600."""
+        config_file.chmod(0o644)
+        AgentConfigManager(str(config_file)).set_default_agent("gemini")
+
+        assert config_file.stat().st_mode & 0o777 == 0o644
+        assert "default_agent: gemini" in config_file.read_text()
+
+
+# ============================================================================
+# FIRST RUN TESTS
+# ============================================================================
+
+class TestFirstRun:
+    """Test creating the config file when none exists."""
+
+    def test_missing_file_written_with_defaults(self, tmp_path):
+        """The first manager writes its default config, which later loads back."""
+        path = tmp_path / ".claude-agents" / "config.yml"
+
+        first = AgentConfigManager(str(path))
+        second = AgentConfigManager(str(path))
+
+        assert path.exists()
+        assert second.config == first.config
+
+    def test_concurrently_created_file_not_overwritten(self, config_file):
+        """If another writer creates the file first, its content is loaded, not replaced."""
+        with patch.object(agent_config.os.path, "exists", return_value=False):
+            manager = AgentConfigManager(str(config_file))
+
+        assert config_file.read_text() == SAMPLE_CONFIG
+        assert manager.get_default_agent() == "qwen"
+
+    def test_template_loads(self, tmp_path, capsys):
+        """The init_config_file template is a valid config for the manager."""
+        path = tmp_path / "config.yml"
+        agent_config.init_config_file(str(path))
+        agent_config.init_config_file(str(path))
+
+        manager = AgentConfigManager(str(path))
+        assert "Warning" not in capsys.readouterr().out
+        assert manager.config.agent_overrides["qwen"].agent_id == "qwen"
+        assert "aider" in manager.config.custom_agents
@@ -0,0 +1,219 @@
+"""
+Tests for ClaudeWorker in yolo_mode/scripts/yolo_loop.py
+
+Tests stream-json framing (result, is_error, EOF mid-turn), the per-turn
+deadline, and the one-process-per-prompt standby handoff against a fake Popen.
+"""
+
+import io
+import json
+import os
+
+import pytest
+
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from yolo_mode.scripts import yolo_loop
+
+
+class _RecordingStdin(io.BytesIO):
+    """stdin pipe stand-in that keeps what was written after close()."""
+
+    def close(self):
+        if not self.closed:
+            self.written = self.getvalue()
+        super().close()
+
+
+class FakePopen:
+    """A `claude` process whose stdout is a real pipe preloaded with `output`.
+
+    The pipe's write end stays open when `eof` is False, which simulates a
+    process that hangs mid-turn.
+    """
+
+    def __init__(self, output=b"", eof=True):
+        read_fd, self._write_fd = os.pipe()
+        self.stdin = _RecordingStdin()
+        self.stdout = os.fdopen(read_fd, "rb")
+        self.returncode = None
+        self.killed = False
+        if output:
+            os.write(self._write_fd, output)
+        if eof:
+            self._close_write_end()
+
+    def _close_write_end(self):
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+            self._write_fd = None
+
+    def prompt(self):
+        """The user message the worker sent to this process, or None."""
+        written = getattr(self.stdin, "written", b"")
+        return json.loads(written)["message"]["content"] if written else None
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if self.returncode is None:
+            if self._write_fd is not None:
+                # stdout still open: the process is still running
+                raise yolo_loop.subprocess.TimeoutExpired("claude", timeout)
+            self.returncode = 0
+        return self.returncode
+
+    def release(self):
+        """Closes both pipe ends; called at test teardown."""
+        self._close_write_end()
+        self.stdout.close()
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+        self._close_write_end()
+
+
+def _events(*events):
+    return b"".join(json.dumps(e).encode() + b"\n" for e in events)
+
+
+@pytest.fixture
+def install_popen(monkeypatch):
+    """Makes subprocess.Popen hand out the given fakes in order, then idle standbys."""
+    spawned = []
+
+    def install(*procs):
+        queue = list(procs)
+
+        def fake_popen(cmd, **kwargs):
+            proc = queue.pop(0) if queue else FakePopen(eof=False)
+            spawned.append(proc)
+            return proc
+
+        monkeypatch.setattr(yolo_loop.subprocess, "Popen", fake_popen)
+        return spawned
+
+    yield install
+    for proc in spawned:
+        proc.release()
+
+
+# ============================================================================
+# FRAMING TESTS
+# ============================================================================
+
+class TestClaudeWorkerFraming:
+    """Test reading a turn's stream-json output up to its result event."""
+
+    def test_returns_result_text(self, install_popen):
+        """The result event's text is returned; earlier events are skipped."""
+        proc = FakePopen(_events(
+            {"type": "system", "subtype": "init"},
+            {"type": "assistant", "message": {"content": []}},
+            {"type": "result", "subtype": "success", "is_error": False, "result": "done"},
+        ))
+        install_popen(proc)
+
+        assert yolo_loop.ClaudeWorker().run("Do the task") == "done"
+        assert proc.prompt() == "Do the task"
+
+    def test_ignores_non_protocol_output(self, install_popen):
+        """Lines that aren't JSON objects must not break the read."""
+        proc = FakePopen(b"warming up\n[1, 2]\n" + _events({"type": "result", "result": "ok"}))
+        install_popen(proc)
+
+        assert yolo_loop.ClaudeWorker().run("Task") == "ok"
+
+    def test_is_error_result_returns_none(self, install_popen):
+        """An is_error result is a failed turn."""
+        proc = FakePopen(_events(
+            {"type": "result", "subtype": "error_during_execution", "is_error": True, "result": ""},
+        ))
+        install_popen(proc)
+
+        assert yolo_loop.ClaudeWorker().run("Task") is None
+
+    def test_eof_mid_turn_returns_none(self, install_popen):
+        """stdout closing before a result event means the process died."""
+        proc = FakePopen(_events({"type": "system", "subtype": "init"}))
+        install_popen(proc)
+
+        assert yolo_loop.ClaudeWorker().run("Task") is None
+
+    def test_missing_cli_returns_none(self, monkeypatch):
+        """A missing `claude` binary is reported, not raised."""
+        def fake_popen(cmd, **kwargs):
+            raise FileNotFoundError(cmd[0])
+
+        monkeypatch.setattr(yolo_loop.subprocess, "Popen", fake_popen)
+
+        assert yolo_loop.ClaudeWorker().run("Task") is None
+
+
+# ============================================================================
+# DEADLINE AND PROCESS LIFECYCLE TESTS
+# ============================================================================
+
+class TestClaudeWorkerLifecycle:
+    """Test the per-turn deadline and one-process-per-prompt handoff."""
+
+    def test_hung_turn_is_killed_at_deadline(self, install_popen):
+        """A turn with no result before the deadline is killed, not waited on."""
+        hung = FakePopen(_events({"type": "system", "subtype": "init"}), eof=False)
+        install_popen(hung)
+
+        assert yolo_loop.ClaudeWorker(turn_timeout=0.2).run("Task") is None
+        assert hung.killed
+
+    def test_next_prompt_runs_after_hung_turn(self, install_popen):
+        """After a kill, the next prompt is served by the standby process."""
+        hung = FakePopen(eof=False)
+        standby = FakePopen(_events({"type": "result", "result": "recovered"}))
+        install_popen(hung, standby)
+
+        worker = yolo_loop.ClaudeWorker(turn_timeout=0.2)
+        assert worker.run("First") is None
+        assert worker.run("Second") == "recovered"
+        assert standby.prompt() == "Second"
+
+    def test_each_prompt_gets_its_own_process(self, install_popen):
+        """Prompts must not share a process, so context can't leak between tasks."""
+        first = FakePopen(_events({"type": "result", "result": "one"}))
+        second = FakePopen(_events({"type": "result", "result": "two"}))
+        spawned = install_popen(first, second)
+
+        worker = yolo_loop.ClaudeWorker()
+        assert worker.run("Task one") == "one"
+        assert worker.run("Task two") == "two"
+
+        assert first.prompt() == "Task one"
+        assert second.prompt() == "Task two"
+        # first, second, plus the standby started while "Task two" ran
+        assert len(spawned) == 3
+
+    def test_standby_is_started_before_the_turn_finishes(self, install_popen):
+        """A replacement process is spawned as soon as a prompt is handed off."""
+        proc = FakePopen(_events({"type": "result", "result": "ok"}))
+        spawned = install_popen(proc)
+
+        worker = yolo_loop.ClaudeWorker()
+        worker.run("Task")
+
+        assert len(spawned) == 2
+        assert worker.standby is spawned[1]
+        assert spawned[1].prompt() is None
+
+    def test_close_kills_idle_standby(self, install_popen):
+        """close() shuts down the standby, which never received a prompt."""
+        install_popen(FakePopen(_events({"type": "result", "result": "ok"})))
+
+        worker = yolo_loop.ClaudeWorker()
+        worker.run("Task")
+        standby = worker.standby
+        worker.close()
+
+        assert standby.killed
+        assert worker.standby is None
@@ -0,0 +1,337 @@
+"""
+Tests for yolo_mode/scripts/yolo_loop.py
+
+Tests pending-task discovery, batch execution/verification, the main loop, and CLI validation.
+"""
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from yolo_mode.scripts import yolo_loop
+
+
+# ============================================================================
+# PENDING TASK DISCOVERY TESTS
+# ============================================================================
+
+class TestFindPendingTasks:
+    """Test plan parsing into (line_index, task) items."""
+
+    def test_multiple_pending_tasks(self):
+        """Pending tasks should be returned in plan order with their line index."""
+        plan = "- [x] Done\n- [ ] First\n- [ ] Second\n"
+        assert yolo_loop.find_pending_tasks(plan) == [(1, "First"), (2, "Second")]
+
+    def test_no_pending_tasks(self):
+        """A fully checked-off plan has nothing pending."""
+        plan = "- [x] Done\n- [x] Also done\n"
+        assert yolo_loop.find_pending_tasks(plan) == []
+
+    def test_duplicate_task_text(self):
+        """Tasks with identical text should be tracked separately."""
+        plan = "- [ ] Run tests\n- [ ] Fix bug\n- [ ] Run tests\n"
+        assert yolo_loop.find_pending_tasks(plan) == [
+            (0, "Run tests"), (1, "Fix bug"), (2, "Run tests")
+        ]
+
+    def test_checkbox_inside_task_text(self):
+        """A "- [ ]" inside a task's text is not a second item."""
+        plan = "- [ ] Document the - [ ] syntax\n- [x] Explain - [ ] markers\n"
+        assert yolo_loop.find_pending_tasks(plan) == [(0, "Document the - [ ] syntax")]
+
+
+# ============================================================================
+# BATCH EXECUTION TESTS
+# ============================================================================
+
+def _check_off(plan_file, task, occurrence=0):
+    """Does what a worker agent does on success: marks its own line as done."""
+    lines = plan_file.read_text().splitlines(keepends=True)
+    matches = [i for i, text in yolo_loop.find_pending_tasks("".join(lines)) if text == task]
+    target = matches[occurrence]
+    lines[target] = lines[target].replace("[ ]", "[x]", 1)
+    plan_file.write_text("".join(lines))
+
+
+class TestRunBatch:
+    """Test per-task execution and plan verification with run_agent mocked."""
+
+    def _run(self, tmp_path, plan, batch_size, behaviour):
+        """Runs a batch where behaviour[task] is "done", "silent" or "fail"."""
+        plan_file = tmp_path / "YOLO_PLAN.md"
+        plan_file.write_text(plan)
+        pending = yolo_loop.find_pending_tasks(plan)[:batch_size]
+
+        def fake_run_agent(agent, prompt, verbose=False, claude_worker=None):
+            for task, action in behaviour.items():
+                if prompt == f"do {task}":
+                    if action == "fail":
+                        return None
+                    if action == "done":
+                        _check_off(plan_file, task)
+                    return "ok"
+            raise AssertionError("unexpected prompt")
+
+        routes = [("gemini", f"do {task}") for _, task in pending]
+        with patch.object(yolo_loop, "run_agent", side_effect=fake_run_agent):
+            results, plan_after = yolo_loop.run_batch(
+                pending, routes, plan, str(plan_file), [None]
+            )
+        # The verification snapshot is what the loop carries into the next iteration
+        assert plan_after == plan_file.read_text()
+        return plan_after, results
+
+    def test_checked_off_tasks_are_completed(self, tmp_path):
+        """Tasks their agents checked off should be reported completed."""
+        plan, results = self._run(
+            tmp_path, "- [ ] A\n- [ ] B\n- [ ] C\n", 2, {"A": "done", "B": "done"}
+        )
+        assert plan == "- [x] A\n- [x] B\n- [ ] C\n"
+        assert results == [(0, "A", True), (1, "B", True)]
+
+    def test_clean_exit_without_check_off_stays_pending(self, tmp_path):
+        """A successful exit alone is not proof of completion."""
+        plan, results = self._run(
+            tmp_path, "- [ ] A\n- [ ] B\n", 2, {"A": "silent", "B": "done"}
+        )
+        assert plan == "- [ ] A\n- [x] B\n"
+        assert results == [(0, "A", False), (1, "B", True)]
+
+    def test_failed_task_stays_pending(self, tmp_path):
+        """A task whose agent failed should not be reported completed."""
+        plan, results = self._run(
+            tmp_path, "- [ ] A\n- [ ] B\n", 2, {"A": "fail", "B": "done"}
+        )
+        assert plan == "- [ ] A\n- [x] B\n"
+        assert results == [(0, "A", False), (1, "B", True)]
+
+    def test_deleted_plan_is_reported(self, tmp_path):
+        """If the plan vanishes mid-batch, nothing is credited and no snapshot is returned."""
+        plan_file = tmp_path / "YOLO_PLAN.md"
+        plan_file.write_text("- [ ] A\n")
+
+        def deleting_agent(agent, prompt, verbose=False, claude_worker=None):
+            plan_file.unlink()
+            return "ok"
+
+        with patch.object(yolo_loop, "run_agent", side_effect=deleting_agent):
+            results, plan_after = yolo_loop.run_batch(
+                [(0, "A")], [("gemini", "do A")], "- [ ] A\n", str(plan_file), [None]
+            )
+        assert results == [(0, "A", False)]
+        assert plan_after is None
+
+    def test_contract_charged_per_finished_task(self, tmp_path):
+        """Each task that produced output is charged against the contract once."""
+        contract = yolo_loop.ContractFactory.default()
+        contract.activate()
+        with patch.object(yolo_loop, "track_consumption") as track:
+            plan_file = tmp_path / "YOLO_PLAN.md"
+            plan_file.write_text("- [ ] A\n- [ ] B\n")
+            routes = [("gemini", "do A"), ("gemini", "do B")]
+            outputs = {"do A": "out", "do B": None}
+            with patch.object(yolo_loop, "run_agent", side_effect=lambda a, p, **kw: outputs[p]):
+                yolo_loop.run_batch(
+                    [(0, "A"), (1, "B")], routes, plan_file.read_text(), str(plan_file), [None], contract
+                )
+        track.assert_called_once_with(contract, "out", False)
+
+    def test_prompt_asks_agent_to_check_off_its_line(self):
+        """Workers are responsible for marking their own task."""
+        prompt = yolo_loop.build_role_based_prompt("coder", "A", "goal", "YOLO_PLAN.md")
+        assert "mark this task as '[x]'" in prompt
+        assert "change only the line for YOUR task" in prompt
+
+    def test_prompt_references_plan_instead_of_inlining_it(self):
+        """The agent is pointed at the plan file; its content isn't sent."""
+        prompt = yolo_loop.build_role_based_prompt("coder", "A", "goal", "YOLO_PLAN.md")
+        assert "Read 'YOLO_PLAN.md' to see the current plan status." in prompt
+        assert "```" not in prompt
+
+    def test_prompt_head_reused_across_tasks(self):
+        """Tasks for the same role and goal reuse the rendered head; only the task differs."""
+        first = yolo_loop.build_role_based_prompt("qa", "A", "cache goal", "YOLO_PLAN.md")
+        hits = yolo_loop._role_prompt_head.cache_info().hits
+        second = yolo_loop.build_role_based_prompt("qa", "B", "cache goal", "YOLO_PLAN.md")
+        assert yolo_loop._role_prompt_head.cache_info().hits == hits + 1
+        assert first.replace("TASK\nA\n", "TASK\nB\n") == second
+
+    def test_route_uses_the_detected_role_persona(self):
+        """The prompt should carry the persona of the role detected for the task."""
+        _, prompt = yolo_loop.route_task(
+            "Audit the login flow for security vulnerabilities", "gemini", "goal", "YOLO_PLAN.md"
+        )
+        assert "SECURITY Role" in prompt
+
+
+class TestVerifyBatch:
+    """Test per-task verification against before/after plan snapshots."""
+
+    def test_duplicate_tasks_verified_independently(self):
+        """Checking off one of two identical tasks completes exactly one."""
+        before = "- [ ] Run tests\n- [ ] Fix bug\n- [ ] Run tests\n"
+        after = "- [x] Run tests\n- [ ] Fix bug\n- [ ] Run tests\n"
+        batch = [(0, "Run tests"), (2, "Run tests")]
+        assert yolo_loop.verify_batch(batch, before, after) == [
+            (0, "Run tests", True), (2, "Run tests", False)
+        ]
+
+    def test_shifted_index_lands_on_other_pending_task(self):
+        """Lines inserted above a task must not credit or blame the task now at its old index."""
+        before = "- [ ] A\n- [ ] B\n"
+        # An agent inserted a line: index 1 now holds the still-pending "A"
+        after = "- [ ] Setup\n- [ ] A\n- [x] B\n"
+        batch = [(1, "B")]
+        assert yolo_loop.verify_batch(batch, before, after) == [(1, "B", True)]
+
+    def test_shifted_index_unfinished_task(self):
+        """A shifted task that wasn't checked off stays pending even if its old index now holds a done line."""
+        before = "- [ ] A\n- [ ] B\n"
+        after = "- [x] Setup\n- [ ] A\n- [ ] B\n"
+        batch = [(0, "A")]
+        assert yolo_loop.verify_batch(batch, before, after) == [(0, "A", False)]
+
+    def test_removed_task_counts_as_done(self):
+        """A task the agent removed from the plan is no longer pending."""
+        assert yolo_loop.verify_batch([(0, "A")], "- [ ] A\n", "") == [(0, "A", True)]
+
+    def test_in_place_check_off_skips_plan_rescan(self):
+        """When only the dispatched lines flipped, no full pending-task scan is needed."""
+        before = "# Plan\n- [ ] A\n- [ ] B\n- [ ] C\n"
+        after = "# Plan\n- [x] A\n- [ ] B\n- [X] C\n"
+        with patch.object(yolo_loop, "find_pending_tasks", side_effect=AssertionError):
+            assert yolo_loop.verify_batch([(1, "A"), (2, "B"), (3, "C")], before, after) == [
+                (1, "A", True), (2, "B", False), (3, "C", True)
+            ]
+
+    def test_duplicate_checked_off_on_other_line(self):
+        """Checking off an identical undispatched line still credits the dispatched item."""
+        before = "- [ ] A\n- [ ] A\n"
+        after = "- [ ] A\n- [x] A\n"
+        assert yolo_loop.verify_batch([(0, "A")], before, after) == [(0, "A", True)]
+
+
+# ============================================================================
+# PLAN WRITE TESTS
+# ============================================================================
+
+class TestWritePlan:
+    """Test atomic plan file replacement."""
+
+    def test_replaces_content_and_keeps_permissions(self, tmp_path):
+        """The plan is swapped in by rename, with its mode kept and no temp file left behind."""
+        plan_file = tmp_path / "YOLO_PLAN.md"
+        plan_file.write_text("- [ ] A\n")
+        plan_file.chmod(0o644)
+        old_inode = plan_file.stat().st_ino
+
+        yolo_loop.write_plan(str(plan_file), "- [x] A\n")
+
+        assert plan_file.read_text() == "- [x] A\n"
+        assert plan_file.stat().st_ino != old_inode
+        assert plan_file.stat().st_mode & 0o777 == 0o644
+        assert os.listdir(tmp_path) == ["YOLO_PLAN.md"]
+
+    def test_mark_task_completed_writes_atomically(self, tmp_path):
+        """The parallel executor's check-off goes through write_plan."""
+        plan_file = tmp_path / "YOLO_PLAN.md"
+        plan_file.write_text("- [ ] A\n- [ ] B\n")
+        yolo_loop.ParallelExecutor(max_workers=1)._mark_task_completed("B", str(plan_file))
+        assert plan_file.read_text() == "- [ ] A\n- [x] B\n"
+
+
+# ============================================================================
+# AGENT OUTPUT STREAMING TESTS
+# ============================================================================
+
+class TestStreamCommand:
+    """Test running a non-claude agent with streamed stdout."""
+
+    def test_collects_output_and_echoes_when_verbose(self, capsys):
+        """Every stdout line should be returned, and printed as it arrives when verbose."""
+        cmd = [sys.executable, "-c", "print('one'); print('two')"]
+        returncode, stdout, stderr = yolo_loop.stream_command(cmd, verbose=True)
+
+        assert (returncode, stdout, stderr) == (0, "one\ntwo\n", "")
+        assert capsys.readouterr().out == "Output:\none\ntwo\n"
+
+    def test_quiet_run_reports_stderr_on_failure(self, capsys):
+        """A failing agent's stderr is returned for the error message, nothing is echoed."""
+        cmd = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+        returncode, stdout, stderr = yolo_loop.stream_command(cmd)
+
+        assert (returncode, stdout, stderr) == (3, "", "boom")
+        assert capsys.readouterr().out == ""
+
+
+# ============================================================================
+# CLI TESTS
+# ============================================================================
+
+class TestCli:
+    """Test command-line validation."""
+
+    @pytest.mark.parametrize("value", ["0", "-1"])
+    def test_max_workers_must_be_positive(self, value):
+        """--max-workers below 1 should be rejected before any agent runs."""
+        argv = ["yolo_loop.py", "goal", "--max-workers", value]
+        with patch("sys.argv", argv), patch.object(yolo_loop, "_run_loop") as run_loop:
+            with pytest.raises(SystemExit):
+                yolo_loop.main()
+        run_loop.assert_not_called()
+
+    def test_max_workers_defaults_to_serial(self):
+        """Without --max-workers the loop should run one task at a time."""
+        argv = ["yolo_loop.py", "goal", "--agent", "gemini"]
+        with patch("sys.argv", argv), patch.object(yolo_loop, "_run_loop") as run_loop:
+            yolo_loop.main()
+        assert run_loop.call_args.args[-1] == 1
+
+
+# ============================================================================
+# LOOP TESTS
+# ============================================================================
+
+class TestRunLoop:
+    """Test the plan -> execute -> verify loop."""
+
+    def _run(self, plan_file, agent_side_effect):
+        with patch.object(yolo_loop, "run_agent", side_effect=agent_side_effect) as run_agent, \
+                patch("builtins.input", return_value=""):
+            yolo_loop._run_loop("goal", False, "gemini", str(plan_file), None, None, [None], 1)
+        return run_agent
+
+    def test_stops_after_two_iterations_without_progress(self, tmp_path, capsys):
+        """An agent that never checks off its task is given up on after two tries."""
+        plan_file = tmp_path / "YOLO_PLAN.md"
+        plan_file.write_text("- [ ] A\n- [ ] B\n")
+
+        run_agent = self._run(plan_file, lambda *a, **kw: "ok")
+
+        assert run_agent.call_count == 2
+        out = capsys.readouterr().out
+        assert "No progress" in out
+        assert "- [ ] A\n" in out and "- [ ] B\n" in out
+
+    def test_progress_resets_stuck_count(self, tmp_path):
+        """A task that needs a retry doesn't stop the loop once the next one progresses."""
+        plan_file = tmp_path / "YOLO_PLAN.md"
+        plan_file.write_text("- [ ] A\n- [ ] B\n")
+        calls = []
+
+        def agent(_, prompt, **kw):
+            calls.append(prompt)
+            # Fail A's first attempt only; every other attempt checks its task off.
+            if len(calls) > 1:
+                task = "A" if "TASK\nA\n" in prompt else "B"
+                plan_file.write_text(plan_file.read_text().replace(f"- [ ] {task}", f"- [x] {task}"))
+            return "ok"
+
+        self._run(plan_file, agent)
+
+        assert len(calls) == 3
+        assert plan_file.read_text() == "- [x] A\n- [x] B\n"
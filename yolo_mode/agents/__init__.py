@@ -38,92 +38,103 @@ Based on research from:
     - reference/OSA_IMPROVEMENT_RECOMMENDATIONS.md
 """
 
-from .registry import (
-    # Enums
-    AgentCapability,
-    OSARole,
+import importlib
+
+# Public names, mapped to the submodule that defines them. Submodules are only
+# imported when one of their names is first accessed (PEP 562), so importing
+# yolo_mode.agents doesn't pull in yaml, the manager or the executor unless
+# they're used.
+_LAZY_ATTRS = {
+    # Registry
+    "AgentCapability": "registry",
+    "OSARole": "registry",
+    "AgentConfig": "registry",
+    "AGENT_REGISTRY": "registry",
+    "get_agent_for_role": "registry",
+    "get_agent_for_capability": "registry",
+    "get_all_agents": "registry",
+    "get_agent_config": "registry",
+    "is_agent_available": "registry",
+    "get_role_description": "registry",
+    "print_registry_summary": "registry",
+
+    # Runner
+    "AgentRunner": "runner",
+    "run_agent": "runner",
+    "run_agent_interactive": "runner",
+    "get_execution_stats": "runner",
+    "print_execution_stats": "runner",
+    "run_agent_legacy": "runner",
+
+    # Role Detection
+    "detect_role": "role_detection",
+    "detect_role_and_agent": "role_detection",
+    "detect_role_with_confidence": "role_detection",
+    "detect_capability": "role_detection",
+    "detect_task_complexity": "role_detection",
+    "clear_detection_caches": "role_detection",
+    "select_agent_by_context": "role_detection",
+    "detect_roles_for_batch": "role_detection",
+    "group_tasks_by_role": "role_detection",
+    "get_role_prompt": "role_detection",
+    "print_detection_result": "role_detection",
+
+    # Resource Aware
+    "ResourceAwareSelector": "resource_aware",
+    "build_contract_aware_prompt": "resource_aware",
+    "optimize_agent_batch": "resource_aware",
+    "group_tasks_by_agent": "resource_aware",
+    "create_child_contract": "resource_aware",
+    "allocate_batch_contracts": "resource_aware",
+    "get_agent_profile": "resource_aware",
+    "print_selection_stats": "resource_aware",
+
+    # Manager Agent
+    "ManagerAction": "manager",
+    "OSAManagerAgent": "manager",
+    "create_manager": "manager",
+    "Task": "manager",
+    "WorkflowState": "manager",
+
+    # Parallel Executor
+    "ContractAwareExecutor": "parallel_executor",
+    "create_executor": "parallel_executor",
+    "TaskResult": "parallel_executor",
 
     # Configuration
-    AgentConfig,
-    AGENT_REGISTRY,
-
-    # Selection functions
-    get_agent_for_role,
-    get_agent_for_capability,
-    get_all_agents,
-    get_agent_config,
-    is_agent_available,
-
-    # Utilities
-    get_role_description,
-    print_registry_summary,
-)
-
-from .runner import (
-    # Main runner class
-    AgentRunner,
-
-    # Convenience functions
-    run_agent,
-    run_agent_interactive,
-    get_execution_stats,
-    print_execution_stats,
-
-    # Legacy compatibility
-    run_agent_legacy,
-)
-
-from .role_detection import (
-    # Role detection
-    detect_role,
-    detect_role_and_agent,
-    detect_role_with_confidence,
-
-    # Capability detection
-    detect_capability,
-    detect_task_complexity,
-
-    # Context-aware selection
-    select_agent_by_context,
-
-    # Batch processing
-    detect_roles_for_batch,
-    group_tasks_by_role,
-
-    # Utilities
-    get_role_prompt,
-    print_detection_result,
-)
-
-from . import resource_aware  # noqa: F401
-from . import manager  # noqa: F401
-from . import parallel_executor  # noqa: F401
-from . import config  # noqa: F401
-from .resource_aware import (
-    # Resource-aware selection
-    ResourceAwareSelector,
-    build_contract_aware_prompt,
-
-    # Batch optimization
-    optimize_agent_batch,
-    group_tasks_by_agent,
-
-    # Child contract allocation
-    create_child_contract,
-    allocate_batch_contracts,
-
-    # Utilities
-    get_agent_profile,
-    print_selection_stats,
-)
-
-# Mini-SWE-Agent integration
-from .mini_swe_agent import (
-    MiniSweAgentRunner,
-    MiniSweResult,
-    run_mini_swe_agent,
-    is_mini_available,
-)
+    "AgentConfigManager": "config",
+    "create_config": "config",
+    "init_config_file": "config",
+    "AgentOverride": "config",
+    "CustomAgent": "config",
+    "AgentConfigFile": "config",
+
+    # Mini-SWE-Agent integration
+    "MiniSweAgentRunner": "mini_swe_agent",
+    "MiniSweResult": "mini_swe_agent",
+    "run_mini_swe_agent": "mini_swe_agent",
+    "is_mini_available": "mini_swe_agent",
+}
+
+_SUBMODULES = frozenset(_LAZY_ATTRS.values())
+
+
+def __getattr__(name):
+    """Import the submodule providing `name` on first access."""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache it so later lookups don't come back through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+
 
 __all__ = [
     # Enums
@@ -156,6 +167,7 @@ __all__ = [
     "detect_role_with_confidence",
     "detect_capability",
     "detect_task_complexity",
+    "clear_detection_caches",
     "select_agent_by_context",
     "detect_roles_for_batch",
     "group_tasks_by_role",
@@ -204,4 +216,4 @@ __author__ = "YOLO Mode Contributors"
 
 # Print registry summary on import for debugging (optional)
 # Uncomment to see all registered agents on module load
-# print_registry_summary()
+# from .registry import print_registry_summary; print_registry_summary()
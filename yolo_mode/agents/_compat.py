@@ -0,0 +1,11 @@
+"""
+Python version compatibility helpers for the agents package.
+"""
+
+import sys
+
+
+# Keyword arguments for @dataclass on hot, frequently instantiated types.
+# dataclass(slots=True) drops the per-instance __dict__ but needs Python
+# 3.10+; older interpreters get regular dataclasses.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
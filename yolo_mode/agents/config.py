@@ -8,10 +8,21 @@ agent priorities without editing code.
 Configuration file location: .claude-agents/config.yml
 """
 
+import copy
 import os
+import sys
+import tempfile
 import yaml
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field, fields
+
+from yolo_mode.agents._compat import DATACLASS_SLOTS
+
+# Use the libyaml C parser/emitter when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # Try to import YOLO components
 try:
@@ -26,7 +37,7 @@ except ImportError:
 # CONFIGURATION DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentOverride:
     """Override configuration for a built-in agent."""
     agent_id: str
@@ -38,7 +49,7 @@ class AgentOverride:
     timeout_seconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CustomAgent:
     """Configuration for a custom agent."""
     name: str
@@ -54,7 +65,7 @@ class CustomAgent:
     priority: int = 99
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentConfigFile:
     """Complete agent configuration file structure."""
 
@@ -75,10 +86,120 @@ class AgentConfigFile:
     max_parallel_workers: int = 3
 
 
+# ============================================================================
+# CONFIG FILE I/O
+# ============================================================================
+
+# Parsed YAML per config file, stamped with (st_mtime_ns, st_size). The CLI,
+# runner and manager each build an AgentConfigManager, so without this the
+# same unchanged file is re-parsed several times per process. Any write to
+# the file changes its stamp and forces a fresh parse.
+_PARSED_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _read_config_data(config_path: str) -> Any:
+    """
+    Parse a YAML config file, reusing the last parse if the file is unchanged.
+
+    Args:
+        config_path: Path to the config file
+
+    Returns:
+        A private copy of the parsed data, safe for the caller to mutate
+    """
+    st = os.stat(config_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = os.path.abspath(config_path)
+
+    cached = _PARSED_CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        with open(config_path, 'r') as f:
+            cached = (stamp, yaml.load(f, Loader=SafeLoader))
+        _PARSED_CONFIG_CACHE[key] = cached
+
+    # AgentConfigFile shares nested dicts with the data it's built from
+    return copy.deepcopy(cached[1])
+
+
+def _intern_id(agent_id: Any) -> Any:
+    """Intern an agent id read from the config file.
+
+    Registry keys are literals and already interned, so interned ids from
+    the file compare against them by identity in dict lookups.
+    """
+    return sys.intern(agent_id) if isinstance(agent_id, str) else agent_id
+
+
+def _plain_fields(obj) -> Dict[str, Any]:
+    """Shallow field dict of a config dataclass, for the YAML dumper.
+
+    Field values are already plain lists, dicts and scalars, so unlike
+    dataclasses.asdict() nothing is copied recursively; the dumper only
+    reads them.
+    """
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _create_config_file(config_path: str, content: bytes) -> bool:
+    """
+    Create a config file, unless one already exists.
+
+    Uses exclusive creation, so when two first runs race (or a run races
+    init_config_file) exactly one file is written and nobody overwrites it.
+
+    Args:
+        config_path: Path to the config file
+        content: UTF-8 encoded YAML to write
+
+    Returns:
+        True if the file was created, False if it already existed
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(config_path)), exist_ok=True)
+    try:
+        with open(config_path, 'xb') as f:
+            f.write(content)
+    except FileExistsError:
+        return False
+    return True
+
+
+def _replace_config_file(config_path: str, content: bytes):
+    """
+    Atomically replace a config file's content.
+
+    The YAML is written in one call to a temp file beside the config and
+    renamed over it, so a crash mid-save leaves the old file intact.
+
+    Args:
+        config_path: Path to the config file
+        content: UTF-8 encoded YAML to write
+    """
+    config_dir = os.path.dirname(os.path.abspath(config_path))
+    os.makedirs(config_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=config_dir, prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        try:
+            # mkstemp creates the file 0600; keep the config's own permissions.
+            os.chmod(tmp_path, os.stat(config_path).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 # ============================================================================
 # CONFIGURATION FILE MANAGER
 # ============================================================================
 
+# (config path, agent id) of custom agents already reported as skipped, so
+# the warning is printed once per process rather than per manager.
+_SKIPPED_CUSTOM_AGENTS: Set[Tuple[str, str]] = set()
+
+
 class AgentConfigManager:
     """
     Manages agent configuration from .claude-agents/config.yml
@@ -101,20 +222,37 @@ class AgentConfigManager:
         """
         self.config_path = config_path or self.CONFIG_PATH
         self.config: Optional[AgentConfigFile] = None
+        # get_all_available_agents() result and the merged config of every
+        # agent; refreshed whenever agents change
+        self._available_cache: Optional[List[str]] = None
+        self._effective: Dict[str, AgentConfig] = {}
         self._load_config()
 
+    def _refresh_agent_caches(self):
+        """Recompute results derived from the agent configuration."""
+        self._available_cache = None
+        self._effective = self._build_effective()
+
     def _load_config(self):
         """Load configuration from YAML file."""
+        self._load_config_file()
+        self._refresh_agent_caches()
+
+    def _load_config_file(self):
+        """Set self.config from the YAML file, creating it if missing."""
         if not os.path.exists(self.config_path):
-            # Create default config
+            # Create default config, unless another process or
+            # init_config_file() wrote one first; then load theirs.
             self.config = self._create_default_config()
-            self._save_config()
-            return
+            try:
+                if _create_config_file(self.config_path, self._dump_config().encode("utf-8")):
+                    return
+            except Exception as e:
+                print(f"Error saving config: {e}")
+                return
 
         try:
-            with open(self.config_path, 'r') as f:
-                data = yaml.safe_load(f)
-
+            data = _read_config_data(self.config_path)
             self.config = self._dict_to_config(data)
 
         except Exception as e:
@@ -125,15 +263,19 @@ class AgentConfigManager:
         """Convert dictionary to AgentConfigFile object."""
         overrides = {}
         for agent_id, override_data in data.get("agent_overrides", {}).items():
+            agent_id = _intern_id(agent_id)
+            # Hand-written configs (like DEFAULT_CONFIG_TEMPLATE) key overrides
+            # by agent and don't repeat the id inside each entry.
+            override_data.setdefault("agent_id", agent_id)
             overrides[agent_id] = AgentOverride(**override_data)
 
         custom_agents = {}
         for agent_id, custom_data in data.get("custom_agents", {}).items():
-            custom_agents[agent_id] = CustomAgent(**custom_data)
+            custom_agents[_intern_id(agent_id)] = CustomAgent(**custom_data)
 
         return AgentConfigFile(
             version=data.get("version", "1.0"),
-            default_agent=data.get("default_agent", "claude"),
+            default_agent=_intern_id(data.get("default_agent", "claude")),
             agent_overrides=overrides,
             custom_agents=custom_agents,
             global_settings=data.get("global_settings", {}),
@@ -157,27 +299,28 @@ class AgentConfigManager:
             max_parallel_workers=3
         )
 
-    def _save_config(self) -> bool:
-        """Save configuration to YAML file."""
-        if not self.config:
-            return False
-
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(self.config_path)), exist_ok=True)
-
+    def _dump_config(self) -> str:
+        """Serialize the current configuration to YAML text."""
         data = {
             "version": self.config.version,
             "default_agent": self.config.default_agent,
-            "agent_overrides": self.config.agent_overrides,
-            "custom_agents": self.config.custom_agents,
+            # The safe dumper only emits plain YAML types, so that the file
+            # can be read back by the safe loader.
+            "agent_overrides": {k: _plain_fields(v) for k, v in self.config.agent_overrides.items()},
+            "custom_agents": {k: _plain_fields(v) for k, v in self.config.custom_agents.items()},
             "global_settings": self.config.global_settings,
             "contract_mode": self.config.contract_mode,
             "max_parallel_workers": self.config.max_parallel_workers
         }
+        return yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+
+    def _save_config(self) -> bool:
+        """Save configuration to YAML file."""
+        if not self.config:
+            return False
 
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            _replace_config_file(self.config_path, self._dump_config().encode("utf-8"))
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -193,57 +336,77 @@ class AgentConfigManager:
             agent_id: Agent identifier
 
         Returns:
-            AgentConfig with overrides applied, or None if agent not found
+            AgentConfig with overrides applied, or None if agent not found.
+            The result is shared between calls; don't mutate it.
         """
-        if not YOLO_AVAILABLE:
-            return None
+        return self._effective.get(agent_id)
 
-        # Check for custom agent first
-        if agent_id in self.config.custom_agents:
-            custom = self.config.custom_agents[agent_id]
-            return AgentConfig(
-                name=custom.name,
-                description=custom.description,
-                cli_command=custom.cli_command,
-                yolo_flag=custom.yolo_flag,
-                subcommand=custom.subcommand,
-                model_flag=custom.model_flag,
-                preferred_models=custom.preferred_models,
-                osa_roles=[OSARole(r) for r in custom.osa_roles],
-                capabilities=[AgentCapability(c) for c in custom.capabilities],
-                env_vars=custom.env_vars.copy(),
-                priority=custom.priority
-            )
-
-        # Check for built-in agent
-        if agent_id in AGENT_REGISTRY:
-            base_config = AGENT_REGISTRY[agent_id]
+    def _build_effective(self) -> Dict[str, AgentConfig]:
+        """Merge overrides and custom agents into a config for every agent."""
+        effective: Dict[str, AgentConfig] = {}
+        if not YOLO_AVAILABLE:
+            return effective
+
+        for agent_id in AGENT_REGISTRY:
+            effective[agent_id] = self._builtin_agent_config(agent_id)
+        # Custom agents take precedence over built-ins with the same id
+        for agent_id, custom in self.config.custom_agents.items():
+            try:
+                effective[agent_id] = self._custom_agent_config(custom)
+            except ValueError as e:
+                # Unknown role/capability name: skip this entry, keep the rest
+                if (self.config_path, agent_id) not in _SKIPPED_CUSTOM_AGENTS:
+                    _SKIPPED_CUSTOM_AGENTS.add((self.config_path, agent_id))
+                    print(f"Warning: Skipping custom agent '{agent_id}': {e}")
+        return effective
+
+    def _custom_agent_config(self, custom: CustomAgent) -> AgentConfig:
+        """Build the configuration for a custom agent."""
+        return AgentConfig(
+            name=custom.name,
+            description=custom.description,
+            cli_command=custom.cli_command,
+            yolo_flag=custom.yolo_flag,
+            subcommand=custom.subcommand,
+            model_flag=custom.model_flag,
+            preferred_models=custom.preferred_models,
+            # Sets, like the built-in registry entries, so `role in
+            # config.osa_roles` is a hash probe. Converted once per agent,
+            # when the merged configs are built; AgentConfig freezes them
+            # and copies env_vars.
+            osa_roles={OSARole(r) for r in custom.osa_roles},
+            capabilities={AgentCapability(c) for c in custom.capabilities},
+            env_vars=custom.env_vars,
+            priority=custom.priority
+        )
 
-            # Apply overrides
-            if agent_id in self.config.agent_overrides:
-                override = self.config.agent_overrides[agent_id]
+    def _builtin_agent_config(self, agent_id: str) -> AgentConfig:
+        """Build the configuration for a built-in agent, with its overrides applied."""
+        base_config = AGENT_REGISTRY[agent_id]
 
-                # Merge env vars
-                env_vars = base_config.env_vars.copy()
-                env_vars.update(override.env_vars)
+        # Apply overrides
+        if agent_id in self.config.agent_overrides:
+            override = self.config.agent_overrides[agent_id]
 
-                return AgentConfig(
-                    name=base_config.name,
-                    cli_command=base_config.cli_command,
-                    yolo_flag=override.custom_flags.get("yolo_flag", base_config.yolo_flag),
-                    subcommand=override.custom_flags.get("subcommand", base_config.subcommand),
-                    model_flag=override.custom_flags.get("model_flag", base_config.model_flag),
-                    preferred_models=override.custom_flags.get("preferred_models", base_config.preferred_models),
-                    osa_roles=base_config.osa_roles,
-                    capabilities=base_config.capabilities,
-                    env_vars=env_vars,
-                    priority=override.priority or base_config.priority,
-                    description=override.custom_flags.get("description", base_config.description)
-                )
+            # Merge env vars
+            env_vars = dict(base_config.env_vars)
+            env_vars.update(override.env_vars)
 
-            return base_config
+            return AgentConfig(
+                name=base_config.name,
+                cli_command=base_config.cli_command,
+                yolo_flag=override.custom_flags.get("yolo_flag", base_config.yolo_flag),
+                subcommand=override.custom_flags.get("subcommand", base_config.subcommand),
+                model_flag=override.custom_flags.get("model_flag", base_config.model_flag),
+                preferred_models=override.custom_flags.get("preferred_models", base_config.preferred_models),
+                osa_roles=base_config.osa_roles,
+                capabilities=base_config.capabilities,
+                env_vars=env_vars,
+                priority=override.priority or base_config.priority,
+                description=override.custom_flags.get("description", base_config.description)
+            )
 
-        return None
+        return base_config
 
     def get_all_available_agents(self) -> List[str]:
         """
@@ -251,6 +414,17 @@ class AgentConfigManager:
 
         Includes both built-in and custom agents.
         """
+        # Copy so callers can't mutate the cached list
+        return list(self._available_agents())
+
+    def _available_agents(self) -> List[str]:
+        """Cached get_all_available_agents() result, shared - don't mutate."""
+        if self._available_cache is None:
+            self._available_cache = self._build_available_agents()
+        return self._available_cache
+
+    def _build_available_agents(self) -> List[str]:
+        """Compute the agent list returned by get_all_available_agents()."""
         agents = []
 
         # Add built-in agents (unless disabled)
@@ -275,7 +449,7 @@ class AgentConfigManager:
 
     def set_default_agent(self, agent_id: str) -> bool:
         """Set default agent."""
-        if agent_id not in self.get_all_available_agents():
+        if agent_id not in self._available_agents():
             print(f"Warning: Agent '{agent_id}' not available")
             return False
 
@@ -284,7 +458,8 @@ class AgentConfigManager:
 
     def add_custom_agent(self, agent: CustomAgent) -> bool:
         """Add a custom agent configuration."""
-        self.config.custom_agents[agent.name] = agent
+        self.config.custom_agents[_intern_id(agent.name)] = agent
+        self._refresh_agent_caches()
         return self._save_config()
 
     def remove_agent(self, agent_id: str) -> bool:
@@ -292,11 +467,13 @@ class AgentConfigManager:
         # Try custom agents first
         if agent_id in self.config.custom_agents:
             del self.config.custom_agents[agent_id]
+            self._refresh_agent_caches()
             return self._save_config()
 
         # Try overrides
         if agent_id in self.config.agent_overrides:
             del self.config.agent_overrides[agent_id]
+            self._refresh_agent_caches()
             return self._save_config()
 
         return False
@@ -332,7 +509,7 @@ class AgentConfigManager:
                 print(f"    Name: {config.name}")
                 print(f"    Command: {config.cli_command}")
                 if config.osa_roles:
-                    print(f"    Roles: {[r.value for r in config.osa_roles]}")
+                    print(f"    Roles: {', '.join(config.role_names)}")
                 if config.priority != 99:
                     print(f"    Priority: {config.priority}")
 
@@ -455,6 +632,9 @@ global_settings:
   auto_continue: true
 """
 
+# Encoded once, so init_config_file() writes it without re-encoding
+_DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG_TEMPLATE.encode("utf-8")
+
 
 # ============================================================================
 # FACTORY FUNCTIONS
@@ -482,14 +662,8 @@ def init_config_file(config_path: Optional[str] = None) -> None:
     """
     config_path = config_path or AgentConfigManager.CONFIG_PATH
 
-    if not os.path.exists(config_path):
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(config_path)), exist_ok=True)
-
-        # Write default template
-        with open(config_path, 'w') as f:
-            f.write(DEFAULT_CONFIG_TEMPLATE)
-
+    # Write default template, leaving an existing config alone
+    if _create_config_file(config_path, _DEFAULT_CONFIG_BYTES):
         print(f"Created default config file: {config_path}")
 
 
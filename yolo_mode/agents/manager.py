@@ -8,16 +8,32 @@ Implements comprehensive workflow orchestration capabilities for autonomous
 multi-agent systems with formal action space.
 """
 
+import functools
+import itertools
 import json
 import os
+import re
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Callable, Any, Tuple
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Mapping, Optional, Callable, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 # Import OSA components
+from ._compat import DATACLASS_SLOTS
 from .registry import AGENT_REGISTRY, OSARole, AgentConfig, get_agent_for_role
 
+# orjson, when installed, encodes and decodes the state file several times
+# faster than the json module. The file is plain JSON either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # MANAGER AGENT ACTION SPACE (16 actions from ACM DAI 2025)
@@ -55,7 +71,17 @@ class ManagerAction(Enum):
 # WORKFLOW STATE REPRESENTATION
 # ============================================================================
 
-@dataclass
+# Most recent manager actions kept in (and saved with) the workflow state
+ACTION_HISTORY_LIMIT = 1000
+
+# Characters of a task description copied into action history entries
+DESCRIPTION_PREVIEW_LENGTH = 100
+
+# Workflows only read the agent registry, so they all share one read-only
+# view of it instead of each taking a copy.
+_REGISTRY_VIEW: Mapping[str, AgentConfig] = MappingProxyType(AGENT_REGISTRY)
+
+@dataclass(**DATACLASS_SLOTS)
 class Task:
     """Represents a task in the workflow."""
     id: str
@@ -66,24 +92,223 @@ class Task:
     dependencies: List[str] = field(default_factory=list)
     created_at: float = field(default_factory=time.time)
     est_duration: float = 1.0  # Estimated hours
+    # Leading part of description for logging, derived when constructed
+    description_preview: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self.description_preview = self.description[:DESCRIPTION_PREVIEW_LENGTH]
 
-@dataclass
+    def set_description(self, description: str):
+        """Replace the description, keeping description_preview in step."""
+        self.description = description
+        self.description_preview = description[:DESCRIPTION_PREVIEW_LENGTH]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class WorkflowState:
-    """State snapshot for Manager Agent decisions."""
+    """
+    State snapshot for Manager Agent decisions.
+
+    Alongside the persisted fields it keeps indexes derived from `tasks`,
+    so status and readiness queries don't rescan every task and dependency
+    on each orchestration step. They are built from `tasks` on construction
+    and kept current incrementally (Kahn-style: completing a task decrements
+    its dependents' unmet counts). Change tasks through the methods below,
+    not by assigning Task fields directly.
+    """
     tasks: Dict[str, Task] = field(default_factory=dict)
-    agents: Dict[str, AgentConfig] = field(default_factory=lambda: AGENT_REGISTRY.copy())
+    agents: Mapping[str, AgentConfig] = field(default_factory=lambda: _REGISTRY_VIEW)
     message_log: List[Dict] = field(default_factory=list)
-    action_history: List[Dict] = field(default_factory=list)
+    action_history: Deque[Dict] = field(default_factory=lambda: deque(maxlen=ACTION_HISTORY_LIMIT))
     completed_count: int = 0
     failed_count: int = 0
     start_time: float = field(default_factory=time.time)
 
+    # Derived indexes (not persisted)
+    status_counts: Counter = field(init=False, repr=False, compare=False)
+    unassigned_count: int = field(init=False, repr=False, compare=False)
+    dependents: Dict[str, List[str]] = field(init=False, repr=False, compare=False)  # prereq -> tasks
+    unmet_deps: Dict[str, int] = field(init=False, repr=False, compare=False)  # prereqs not completed
+    ready: Dict[str, None] = field(init=False, repr=False, compare=False)  # ordered set: pending, unmet 0
+
+    def __post_init__(self):
+        self.status_counts = Counter()
+        self.unassigned_count = 0
+        self.dependents = {}
+        self.unmet_deps = {}
+        self.ready = {}
+        for task in self.tasks.values():
+            self._index(task)
+
+    def _is_done(self, task_id: str) -> bool:
+        """A prerequisite is met once its task is completed (missing tasks never are)."""
+        task = self.tasks.get(task_id)
+        return task is not None and task.status == "completed"
+
+    def _refresh_ready(self, task_id: str):
+        task = self.tasks.get(task_id)
+        if task is not None and task.status == "pending" and self.unmet_deps[task_id] == 0:
+            self.ready[task_id] = None
+        else:
+            self.ready.pop(task_id, None)
+
+    def _index(self, task: Task):
+        self.status_counts[task.status] += 1
+        if task.assigned_to is None:
+            self.unassigned_count += 1
+        for prereq_id in task.dependencies:
+            self.dependents.setdefault(prereq_id, []).append(task.id)
+        self.unmet_deps[task.id] = sum(1 for d in task.dependencies if not self._is_done(d))
+        self._refresh_ready(task.id)
+
+    def _unindex(self, task: Task):
+        self.status_counts[task.status] -= 1
+        if task.assigned_to is None:
+            self.unassigned_count -= 1
+        for prereq_id in task.dependencies:
+            self.dependents[prereq_id].remove(task.id)
+        del self.unmet_deps[task.id]
+        self.ready.pop(task.id, None)
+
+    def _prereq_changed(self, task_id: str, was_done: bool, is_done: bool):
+        """Propagate a task entering or leaving "completed" to its dependents."""
+        if was_done == is_done:
+            return
+        delta = -1 if is_done else 1
+        for dependent_id in self.dependents.get(task_id, ()):
+            self.unmet_deps[dependent_id] += delta
+            self._refresh_ready(dependent_id)
+
+    def add_task(self, task: Task):
+        """Add a task, replacing any task with the same ID."""
+        was_done = self._is_done(task.id)
+        if task.id in self.tasks:
+            self._unindex(self.tasks[task.id])
+        self.tasks[task.id] = task
+        self._index(task)
+        self._prereq_changed(task.id, was_done, task.status == "completed")
+
+    def remove_task(self, task_id: str) -> Task:
+        """Remove a task. Tasks still depending on it stay blocked."""
+        task = self.tasks.pop(task_id)
+        self._unindex(task)
+        self._prereq_changed(task_id, task.status == "completed", False)
+        if not self.dependents.get(task_id):
+            self.dependents.pop(task_id, None)
+        return task
+
+    def set_status(self, task_id: str, status: str):
+        """Move a task to a new status."""
+        task = self.tasks[task_id]
+        old_status = task.status
+        if old_status == status:
+            return
+        self.status_counts[old_status] -= 1
+        self.status_counts[status] += 1
+        task.status = status
+        self._refresh_ready(task_id)
+        self._prereq_changed(task_id, old_status == "completed", status == "completed")
+
+    def assign(self, task_id: str, agent_id: str):
+        """Hand a task to an agent and mark it in progress."""
+        task = self.tasks[task_id]
+        if task.assigned_to is None:
+            self.unassigned_count -= 1
+        task.assigned_to = agent_id
+        self.set_status(task_id, "in_progress")
+
+    def add_dependency(self, task_id: str, prereq_id: str):
+        """Make task_id wait for prereq_id."""
+        self.tasks[task_id].dependencies.append(prereq_id)
+        self.dependents.setdefault(prereq_id, []).append(task_id)
+        if not self._is_done(prereq_id):
+            self.unmet_deps[task_id] += 1
+            self._refresh_ready(task_id)
+
+    def remove_dependency(self, task_id: str, prereq_id: str):
+        """Drop one occurrence of prereq_id from task_id's dependencies."""
+        self.tasks[task_id].dependencies.remove(prereq_id)
+        self.dependents[prereq_id].remove(task_id)
+        if not self._is_done(prereq_id):
+            self.unmet_deps[task_id] -= 1
+            self._refresh_ready(task_id)
+
+    def set_dependencies(self, task_id: str, prereq_ids: List[str]):
+        """Replace a task's dependencies."""
+        for prereq_id in list(self.tasks[task_id].dependencies):
+            self.remove_dependency(task_id, prereq_id)
+        for prereq_id in prereq_ids:
+            self.add_dependency(task_id, prereq_id)
+
+
+# ============================================================================
+# STATE FILE I/O
+# ============================================================================
+
+def _encode_state(data: Dict) -> bytes:
+    """Serialize a state dict to compact JSON (see format_state_file for reading)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_state(content: bytes) -> Dict:
+    """Parse a state file written by _encode_state (or by hand)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _replace_state_file(state_file: str, content: bytes):
+    """
+    Atomically replace the state file's content.
+
+    Written to a temp file beside the state file and renamed over it, so a
+    crash mid-save leaves the previous state intact instead of truncated.
+    """
+    state_dir = os.path.dirname(os.path.abspath(state_file))
+    fd, tmp_path = tempfile.mkstemp(dir=state_dir, prefix=".manager-state-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        try:
+            # mkstemp creates the file 0600; keep the state file's own permissions.
+            os.chmod(tmp_path, os.stat(state_file).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, state_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 # ============================================================================
 # MANAGER AGENT IMPLEMENTATION
 # ============================================================================
 
+# Keywords picking a _generate_subtasks() pattern. Substring matches, as
+# before ("researching" and "added" count), in one case-insensitive scan
+# of the description instead of a lowered copy per keyword.
+_RESEARCH_WORDS = re.compile("research|investigate|analyze|study", re.IGNORECASE)
+_IMPLEMENTATION_WORDS = re.compile("implement|create|build|add", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_detect_role(description: str) -> OSARole:
+    """detect_role(), memoized: decomposed and re-planned tasks repeat descriptions."""
+    from .role_detection import detect_role
+    return detect_role(description)
+
+
+def _synchronized(method):
+    """Run a manager method while holding the manager's lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class OSAManagerAgent:
     """
     OSA Orchestrator with full Manager Agent action space.
@@ -98,6 +323,36 @@ class OSAManagerAgent:
     - Coordinate multi-agent collaboration
     """
 
+    # Longest orchestrate() waits between actions when nothing has changed
+    IDLE_WAIT_SECONDS = 0.1
+
+    # Method implementing each of the 16 actions, shared by every instance.
+    _ACTION_METHODS: Dict[ManagerAction, str] = {
+        # Core workflow
+        ManagerAction.ASSIGN_TASK: "_assign_task",
+        ManagerAction.CREATE_TASK: "_create_task",
+        ManagerAction.REMOVE_TASK: "_remove_task",
+        ManagerAction.SEND_MESSAGE: "_send_message",
+
+        # Info gathering
+        ManagerAction.NOOP: "_noop",
+        ManagerAction.GET_WORKFLOW_STATUS: "_get_workflow_status",
+        ManagerAction.GET_AVAILABLE_AGENTS: "_get_available_agents",
+        ManagerAction.GET_PENDING_TASKS: "_get_pending_tasks",
+
+        # Task management
+        ManagerAction.REFINE_TASK: "_refine_task",
+        ManagerAction.ADD_DEPENDENCY: "_add_dependency",
+        ManagerAction.REMOVE_DEPENDENCY: "_remove_dependency",
+        ManagerAction.INSPECT_TASK: "_inspect_task",
+        ManagerAction.DECOMPOSE_TASK: "_decompose_task",
+
+        # Termination
+        ManagerAction.REQUEST_END: "_request_end",
+        ManagerAction.FAILED_ACTION: "_failed_action",
+        ManagerAction.ASSIGN_ALL: "_assign_all",
+    }
+
     def __init__(self, goal: str, state_file: Optional[str] = None):
         """
         Initialize Manager Agent.
@@ -108,41 +363,58 @@ class OSAManagerAgent:
         """
         self.goal = goal
         self.state_file = state_file or ".claude/manager-state.json"
+        # Resolved once; the directory is created by the first save
+        self._state_path = os.path.abspath(self.state_file)
+        self._state_dir_ready = False
+        # Action history is journaled beside the state file, one JSON entry
+        # per line, instead of being rewritten with the state on every save
+        self._history_path = os.path.splitext(self._state_path)[0] + ".history.jsonl"
+        self._history_lines = 0
+        self._history_rewrite = False  # journal must be rebuilt from memory
         self.state = self._load_state()
         self.actions = self._define_actions()
+        # No action changes the agent set, so its saved form is built once
+        self._agents_blob = {aid: {
+            "name": a.name,
+            "cli_command": a.cli_command,
+            "yolo_flag": a.yolo_flag
+        } for aid, a in self.state.agents.items()}
+        # Actions may be called from executor worker threads. Re-entrant,
+        # since composite actions call other actions.
+        self._lock = threading.RLock()
+        self._task_numbers = itertools.count(len(self.state.tasks) + 1)
+        # Set whenever the workflow state changes, so orchestrate() can
+        # go on as soon as there is something new instead of sleeping
+        self._state_changed = threading.Event()
+        # Composite actions defer their nested saves; see _coalesced_saves()
+        self._save_depth = 0
+        self._save_pending = False
 
     def _define_actions(self) -> Dict[ManagerAction, Callable]:
         """Define all 16 Manager Agent actions."""
-        return {
-            # Core workflow
-            ManagerAction.ASSIGN_TASK: self._assign_task,
-            ManagerAction.CREATE_TASK: self._create_task,
-            ManagerAction.REMOVE_TASK: self._remove_task,
-            ManagerAction.SEND_MESSAGE: self._send_message,
-
-            # Info gathering
-            ManagerAction.NOOP: self._noop,
-            ManagerAction.GET_WORKFLOW_STATUS: self._get_workflow_status,
-            ManagerAction.GET_AVAILABLE_AGENTS: self._get_available_agents,
-            ManagerAction.GET_PENDING_TASKS: self._get_pending_tasks,
-
-            # Task management
-            ManagerAction.REFINE_TASK: self._refine_task,
-            ManagerAction.ADD_DEPENDENCY: self._add_dependency,
-            ManagerAction.REMOVE_DEPENDENCY: self._remove_dependency,
-            ManagerAction.INSPECT_TASK: self._inspect_task,
-            ManagerAction.DECOMPOSE_TASK: self._decompose_task,
-
-            # Termination
-            ManagerAction.REQUEST_END: self._request_end,
-            ManagerAction.FAILED_ACTION: self._failed_action,
-            ManagerAction.ASSIGN_ALL: self._assign_all,
-        }
+        return {action: getattr(self, name) for action, name in self._ACTION_METHODS.items()}
+
+    def dispatch(self, action: ManagerAction, *args, **kwargs) -> Any:
+        """
+        Execute a Manager Agent action.
+
+        Calls the action's method directly rather than going through the
+        bound-method table in `actions`, which is kept for introspection.
+
+        Args:
+            action: The action to execute
+            *args, **kwargs: Passed through to the action
+
+        Returns:
+            The action's result
+        """
+        return getattr(self, self._ACTION_METHODS[action])(*args, **kwargs)
 
     # ========================================================================
     # CORE WORKFLOW ACTIONS
     # ========================================================================
 
+    @_synchronized
     def _assign_task(self, task_id: str, agent_id: str) -> bool:
         """
         Route task to capacity/skill-matched agent.
@@ -163,8 +435,7 @@ class OSAManagerAgent:
             return False
 
         task = self.state.tasks[task_id]
-        task.assigned_to = agent_id
-        task.status = "in_progress"
+        self.state.assign(task_id, agent_id)
 
         self._log_action(ManagerAction.ASSIGN_TASK, {
             "task_id": task_id,
@@ -175,6 +446,28 @@ class OSAManagerAgent:
         self._save_state()
         return True
 
+    @_synchronized
+    def _complete_task(self, task_id: str) -> bool:
+        """
+        Record that an agent finished a task, unblocking its dependents.
+
+        Args:
+            task_id: ID of the finished task
+
+        Returns:
+            True if the task was marked completed
+        """
+        if task_id not in self.state.tasks:
+            return False
+
+        if self.state.tasks[task_id].status != "completed":
+            self.state.set_status(task_id, "completed")
+            self.state.completed_count += 1
+
+        self._save_state()
+        return True
+
+    @_synchronized
     def _create_task(
         self,
         name: str,
@@ -194,7 +487,11 @@ class OSAManagerAgent:
         Returns:
             ID of created task
         """
-        task_id = f"task_{len(self.state.tasks) + 1}_{int(time.time())}"
+        # A running counter, not len(tasks): after a removal, len() would
+        # hand out an ID that is still in use
+        task_id = f"task_{next(self._task_numbers)}_{int(time.time())}"
+        while task_id in self.state.tasks:
+            task_id = f"task_{next(self._task_numbers)}_{int(time.time())}"
 
         task = Task(
             id=task_id,
@@ -205,17 +502,18 @@ class OSAManagerAgent:
             est_duration=est_hrs
         )
 
-        self.state.tasks[task_id] = task
+        self.state.add_task(task)
 
         self._log_action(ManagerAction.CREATE_TASK, {
             "task_id": task_id,
             "name": name,
-            "description": description[:100]
+            "description": task.description_preview
         })
 
         self._save_state()
         return task_id
 
+    @_synchronized
     def _remove_task(self, task_id: str) -> bool:
         """
         Prune out-of-scope/duplicate task.
@@ -229,14 +527,12 @@ class OSAManagerAgent:
         if task_id not in self.state.tasks:
             return False
 
-        task = self.state.tasks[task_id]
-
-        # Remove from any dependent tasks
-        for other_id, other_task in self.state.tasks.items():
-            if task_id in other_task.dependencies:
-                other_task.dependencies.remove(task_id)
+        # Remove from any dependent tasks (every occurrence, so none is left
+        # waiting on a task that no longer exists)
+        for other_id in list(self.state.dependents.get(task_id, ())):
+            self.state.remove_dependency(other_id, task_id)
 
-        del self.state.tasks[task_id]
+        task = self.state.remove_task(task_id)
 
         self._log_action(ManagerAction.REMOVE_TASK, {
             "task_id": task_id,
@@ -246,6 +542,7 @@ class OSAManagerAgent:
         self._save_state()
         return True
 
+    @_synchronized
     def _send_message(self, content: str, receiver_id: Optional[str] = None) -> bool:
         """
         Coordinate, solicit tradeoffs between agents.
@@ -267,7 +564,7 @@ class OSAManagerAgent:
         self.state.message_log.append(message)
 
         self._log_action(ManagerAction.SEND_MESSAGE, {
-            "content": content[:100],
+            "content": content[:DESCRIPTION_PREVIEW_LENGTH],
             "to": receiver_id
         })
 
@@ -286,6 +583,7 @@ class OSAManagerAgent:
             "state": "unchanged"
         }
 
+    @_synchronized
     def _get_workflow_status(self) -> Dict:
         """
         Snapshot workflow health (task histogram, ready set).
@@ -293,13 +591,16 @@ class OSAManagerAgent:
         Returns:
             Dictionary with workflow statistics
         """
+        # Counts are maintained by WorkflowState as tasks change
+        by_status = self.state.status_counts
+
         status = {
             "total_tasks": len(self.state.tasks),
-            "pending": sum(1 for t in self.state.tasks.values() if t.status == "pending"),
-            "in_progress": sum(1 for t in self.state.tasks.values() if t.status == "in_progress"),
-            "completed": sum(1 for t in self.state.tasks.values() if t.status == "completed"),
-            "failed": sum(1 for t in self.state.tasks.values() if t.status == "failed"),
-            "unassigned": sum(1 for t in self.state.tasks.values() if t.assigned_to is None),
+            "pending": by_status["pending"],
+            "in_progress": by_status["in_progress"],
+            "completed": by_status["completed"],
+            "failed": by_status["failed"],
+            "unassigned": self.state.unassigned_count,
             "completion_rate": self.state.completed_count / max(1, len(self.state.tasks)),
             "elapsed_time": time.time() - self.state.start_time
         }
@@ -324,6 +625,7 @@ class OSAManagerAgent:
 
         return agents_info
 
+    @_synchronized
     def _get_pending_tasks(self) -> List[Dict]:
         """
         Triage backlog with preview.
@@ -340,10 +642,7 @@ class OSAManagerAgent:
                     "description": task.description,
                     "dependencies": task.dependencies,
                     "est_duration": task.est_duration,
-                    "can_start": all(
-                        self.state.tasks.get(d, Task(id="", name="")).status == "completed"
-                        for d in task.dependencies
-                    )
+                    "can_start": self.state.unmet_deps[task_id] == 0
                 })
 
         # Sort by dependencies (tasks with fewer deps first)
@@ -355,6 +654,7 @@ class OSAManagerAgent:
     # TASK MANAGEMENT ACTIONS
     # ========================================================================
 
+    @_synchronized
     def _refine_task(self, task_id: str, new_instructions: str) -> bool:
         """
         Tighten scope and clarity of task.
@@ -370,16 +670,17 @@ class OSAManagerAgent:
             return False
 
         task = self.state.tasks[task_id]
-        task.description = new_instructions
+        task.set_description(new_instructions)
 
         self._log_action(ManagerAction.REFINE_TASK, {
             "task_id": task_id,
-            "new_instructions": new_instructions[:100]
+            "new_instructions": task.description_preview
         })
 
         self._save_state()
         return True
 
+    @_synchronized
     def _add_dependency(self, prereq_id: str, dep_id: str) -> bool:
         """
         Enforce sequencing between tasks.
@@ -394,8 +695,8 @@ class OSAManagerAgent:
         if prereq_id not in self.state.tasks or dep_id not in self.state.tasks:
             return False
 
-        if dep_id not in self.state.tasks[dep_id].dependencies:
-            self.state.tasks[dep_id].dependencies.append(prereq_id)
+        if prereq_id not in self.state.tasks[dep_id].dependencies:
+            self.state.add_dependency(dep_id, prereq_id)
 
         self._log_action(ManagerAction.ADD_DEPENDENCY, {
             "prereq": prereq_id,
@@ -405,6 +706,7 @@ class OSAManagerAgent:
         self._save_state()
         return True
 
+    @_synchronized
     def _remove_dependency(self, prereq_id: str, dep_id: str) -> bool:
         """
         Remove obsolete dependency between tasks.
@@ -421,7 +723,7 @@ class OSAManagerAgent:
 
         task = self.state.tasks[dep_id]
         if prereq_id in task.dependencies:
-            task.dependencies.remove(prereq_id)
+            self.state.remove_dependency(dep_id, prereq_id)
 
         self._log_action(ManagerAction.REMOVE_DEPENDENCY, {
             "prereq": prereq_id,
@@ -431,6 +733,7 @@ class OSAManagerAgent:
         self._save_state()
         return True
 
+    @_synchronized
     def _inspect_task(self, task_id: str) -> Optional[Dict]:
         """
         Read-only deep dive into task details.
@@ -446,11 +749,8 @@ class OSAManagerAgent:
 
         task = self.state.tasks[task_id]
 
-        # Get dependent info
-        dependent_tasks = [
-            tid for tid, t in self.state.tasks.items()
-            if task_id in t.dependencies
-        ]
+        # Get dependent info (each dependent once, in the order it was added)
+        dependent_tasks = list(dict.fromkeys(self.state.dependents.get(task_id, ())))
 
         return {
             "id": task.id,
@@ -462,12 +762,10 @@ class OSAManagerAgent:
             "dependents": dependent_tasks,
             "est_duration": task.est_duration,
             "created_at": task.created_at,
-            "can_start": all(
-                self.state.tasks.get(d, Task(id="", name="")).status == "completed"
-                for d in task.dependencies
-            )
+            "can_start": self.state.unmet_deps[task_id] == 0
         }
 
+    @_synchronized
     def _decompose_task(self, task_id: str, max_subtasks: int = 4) -> List[str]:
         """
         Split complex task into subtasks using AI.
@@ -488,25 +786,27 @@ class OSAManagerAgent:
         subtask_descriptions = self._generate_subtasks(parent_task.description, max_subtasks)
 
         subtask_ids = []
-        for i, desc in enumerate(subtask_descriptions, 1):
-            subtask_id = self._create_task(
-                name=f"{parent_task.name} - Part {i}",
-                description=desc,
-                est_hrs=parent_task.est_duration / len(subtask_descriptions),
-                dependencies=[task_id]
-            )
-            subtask_ids.append(subtask_id)
-
-        # Update parent to depend on subtasks
-        parent_task.dependencies = subtask_ids
-
-        self._log_action(ManagerAction.DECOMPOSE_TASK, {
-            "parent_id": task_id,
-            "subtask_count": len(subtask_ids),
-            "subtask_ids": subtask_ids
-        })
+        # One state write for the whole decomposition, not one per subtask
+        with self._coalesced_saves():
+            for i, desc in enumerate(subtask_descriptions, 1):
+                subtask_id = self._create_task(
+                    name=f"{parent_task.name} - Part {i}",
+                    description=desc,
+                    est_hrs=parent_task.est_duration / len(subtask_descriptions),
+                    dependencies=[task_id]
+                )
+                subtask_ids.append(subtask_id)
 
-        self._save_state()
+            # Update parent to depend on subtasks
+            self.state.set_dependencies(task_id, subtask_ids)
+
+            self._log_action(ManagerAction.DECOMPOSE_TASK, {
+                "parent_id": task_id,
+                "subtask_count": len(subtask_ids),
+                "subtask_ids": subtask_ids
+            })
+
+            self._save_state()
         return subtask_ids
 
     def _generate_subtasks(self, description: str, max_count: int) -> List[str]:
@@ -518,22 +818,23 @@ class OSAManagerAgent:
         """
         # Simple decomposition patterns
         subtasks = []
+        summary = description[:50]
 
         # Research tasks
-        if any(word in description.lower() for word in ["research", "investigate", "analyze", "study"]):
+        if _RESEARCH_WORDS.search(description):
             subtasks = [
-                f"Gather requirements for: {description[:50]}",
-                f"Identify key sources for: {description[:50]}",
-                f"Synthesize findings for: {description[:50]}"
+                f"Gather requirements for: {summary}",
+                f"Identify key sources for: {summary}",
+                f"Synthesize findings for: {summary}"
             ]
 
         # Implementation tasks
-        elif any(word in description.lower() for word in ["implement", "create", "build", "add"]):
+        elif _IMPLEMENTATION_WORDS.search(description):
             subtasks = [
-                f"Design structure for: {description[:50]}",
-                f"Implement core functionality: {description[:50]}",
-                f"Add error handling: {description[:50]}",
-                f"Test implementation: {description[:50]}"
+                f"Design structure for: {summary}",
+                f"Implement core functionality: {summary}",
+                f"Add error handling: {summary}",
+                f"Test implementation: {summary}"
             ]
 
         # Default generic decomposition
@@ -548,6 +849,7 @@ class OSAManagerAgent:
     # TERMINATION ACTIONS
     # ========================================================================
 
+    @_synchronized
     def _request_end(self, reason: str) -> bool:
         """
         Signal workflow termination.
@@ -566,13 +868,14 @@ class OSAManagerAgent:
         })
 
         # Mark all pending tasks as cancelled
-        for task in self.state.tasks.values():
+        for task_id, task in self.state.tasks.items():
             if task.status == "pending":
-                task.status = "cancelled"
+                self.state.set_status(task_id, "cancelled")
 
         self._save_state()
         return True
 
+    @_synchronized
     def _failed_action(self, action: ManagerAction, metadata: Dict) -> bool:
         """
         Record provider/system failure.
@@ -595,10 +898,15 @@ class OSAManagerAgent:
         self._save_state()
         return True
 
+    @_synchronized
     def _assign_all(self, agent_ids: Optional[List[str]] = None) -> Dict[str, List[str]]:
         """
         Fast triage for demos - assign all pending tasks.
 
+        Each ready task is queued on the agent best suited to its role, then
+        agents with short queues take tasks from the longest ones until no
+        two queues differ by more than one.
+
         Args:
             agent_ids: Optional list of agents to use (default: all available)
 
@@ -606,23 +914,38 @@ class OSAManagerAgent:
             Dictionary mapping agent_id to list of task_ids
         """
         available_agents = agent_ids or list(self.state.agents.keys())
-        pending_tasks = self._get_pending_tasks()
-
-        assignment = {agent_id: [] for agent_id in available_agents}
-
-        for i, task_info in enumerate(pending_tasks):
-            if not task_info["can_start"]:
-                continue
-
-            # Round-robin assignment
-            agent_id = available_agents[i % len(available_agents)]
-            assignment[agent_id].append(task_info["id"])
-            self._assign_task(task_info["id"], agent_id)
-
-        self._log_action(ManagerAction.ASSIGN_ALL, {
-            "assigned_count": sum(len(tasks) for tasks in assignment.values()),
-            "assignment": {k: len(v) for k, v in assignment.items()}
-        })
+        # Only ready tasks can be assigned; take them straight from the ready
+        # set (copied, since assigning removes them) rather than building and
+        # sorting the full pending-task report
+        ready_tasks = list(self.state.ready)
+
+        # Skill-matched queues
+        queues = {agent_id: deque() for agent_id in available_agents}
+        for task_id in ready_tasks:
+            role = _cached_detect_role(self.state.tasks[task_id].description)
+            queues[get_agent_for_role(role, available_agents)].append(task_id)
+
+        # Work stealing: the least loaded agent takes the newest task from
+        # the most loaded one
+        while queues:
+            busiest = max(queues.values(), key=len)
+            idlest = min(queues.values(), key=len)
+            if len(busiest) - len(idlest) <= 1:
+                break
+            idlest.append(busiest.pop())
+
+        assignment = {agent_id: list(queue) for agent_id, queue in queues.items()}
+
+        # One state write for the whole batch, not one per assignment
+        with self._coalesced_saves():
+            for agent_id, task_ids in assignment.items():
+                for task_id in task_ids:
+                    self._assign_task(task_id, agent_id)
+
+            self._log_action(ManagerAction.ASSIGN_ALL, {
+                "assigned_count": sum(len(tasks) for tasks in assignment.values()),
+                "assignment": {k: len(v) for k, v in assignment.items()}
+            })
 
         return assignment
 
@@ -630,23 +953,39 @@ class OSAManagerAgent:
     # STATE MANAGEMENT
     # ========================================================================
 
+    def _restore_agents(self, saved: Optional[Dict]) -> Mapping[str, AgentConfig]:
+        """
+        Map the agent summaries in a state file back to registry configs.
+
+        The file only records each agent's name and command, so the configs
+        come from the registry; unknown agent IDs are dropped.
+        """
+        if saved is None or saved.keys() == AGENT_REGISTRY.keys():
+            return _REGISTRY_VIEW
+        return MappingProxyType({aid: AGENT_REGISTRY[aid] for aid in saved if aid in AGENT_REGISTRY})
+
     def _load_state(self) -> WorkflowState:
         """Load workflow state from file."""
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    data = _decode_state(f.read())
 
                 # Reconstruct Task objects from dict
                 tasks = {}
                 for tid, tdict in data.get("tasks", {}).items():
                     tasks[tid] = Task(**tdict)
 
+                # Older state files embed the history; move it to the journal
+                history = deque(data.get("action_history", ()), maxlen=ACTION_HISTORY_LIMIT)
+                history.extend(self._read_history())
+                self._history_rewrite = "action_history" in data
+
                 return WorkflowState(
                     tasks=tasks,
-                    agents=data.get("agents", AGENT_REGISTRY.copy()),
+                    agents=self._restore_agents(data.get("agents")),
                     message_log=data.get("message_log", []),
-                    action_history=data.get("action_history", []),
+                    action_history=history,
                     completed_count=data.get("completed_count", 0),
                     failed_count=data.get("failed_count", 0),
                     start_time=data.get("start_time", time.time())
@@ -654,12 +993,87 @@ class OSAManagerAgent:
             except Exception as e:
                 print(f"Warning: Could not load state file: {e}")
 
+        # A journal without usable state belongs to an earlier workflow
+        self._history_rewrite = os.path.exists(self._history_path)
         return WorkflowState()
 
+    def _read_history(self) -> List[Dict]:
+        """Load the newest entries of the history journal (caller bounds the count)."""
+        try:
+            f = open(self._history_path, 'rb')
+        except FileNotFoundError:
+            return []
+        with f:
+            # One spare line in case the last one is torn
+            tail = deque(maxlen=ACTION_HISTORY_LIMIT + 1)
+            count = 0
+            for line in f:
+                tail.append(line)
+                count += 1
+        self._history_lines = count
+
+        entries = []
+        for line in tail:
+            try:
+                entries.append(_decode_state(line))
+            except ValueError:
+                pass  # Torn last line from an interrupted append
+        return entries
+
+    def _record_history(self, entry: Dict):
+        """Append an entry to the history journal, compacting it when it gets long."""
+        if self._history_rewrite or self._history_lines >= 2 * ACTION_HISTORY_LIMIT:
+            self._rewrite_history()
+            return
+        self._ensure_state_dir()
+        with open(self._history_path, 'ab') as f:
+            f.write(_encode_state(entry) + b"\n")
+        self._history_lines += 1
+
+    def _rewrite_history(self):
+        """Replace the history journal with the in-memory (bounded) history."""
+        self._ensure_state_dir()
+        content = b"".join(_encode_state(entry) + b"\n" for entry in self.state.action_history)
+        _replace_state_file(self._history_path, content)
+        self._history_lines = len(self.state.action_history)
+        self._history_rewrite = False
+
+    def _ensure_state_dir(self):
+        if not self._state_dir_ready:
+            os.makedirs(os.path.dirname(self._state_path), exist_ok=True)
+            self._state_dir_ready = True
+
+    @contextmanager
+    def _coalesced_saves(self):
+        """
+        Defer _save_state() inside the block to a single save on exit.
+
+        Composite actions call other actions that each save; without this a
+        decomposition into N subtasks rewrote the state file N + 1 times.
+        Blocks nest; only the outermost one saves, and only if something
+        inside asked to. Use it only while holding the manager's lock.
+        """
+        self._save_depth += 1
+        try:
+            yield
+        finally:
+            self._save_depth -= 1
+            if self._save_depth == 0 and self._save_pending:
+                self._save_state()
+
+    @_synchronized
     def _save_state(self):
         """Persist workflow state to file."""
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+        # Every mutating action ends here, whether or not the write is deferred
+        self._state_changed.set()
+        if self._save_depth:
+            self._save_pending = True
+            return
+        self._save_pending = False
+
+        self._ensure_state_dir()
+        if self._history_rewrite:
+            self._rewrite_history()
 
         data = {
             "tasks": {
@@ -675,21 +1089,16 @@ class OSAManagerAgent:
                 }
                 for tid, t in self.state.tasks.items()
             },
-            "agents": {aid: {
-                "name": a.name,
-                "cli_command": a.cli_command,
-                "yolo_flag": a.yolo_flag
-            } for aid, a in self.state.agents.items()},
+            "agents": self._agents_blob,
             "message_log": self.state.message_log,
-            "action_history": self.state.action_history,
             "completed_count": self.state.completed_count,
             "failed_count": self.state.failed_count,
             "start_time": self.state.start_time
         }
 
-        with open(self.state_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _replace_state_file(self._state_path, _encode_state(data))
 
+    @_synchronized
     def _log_action(self, action: ManagerAction, details: Dict):
         """Log action to history."""
         log_entry = {
@@ -697,17 +1106,15 @@ class OSAManagerAgent:
             "timestamp": time.time(),
             "details": details
         }
+        # Bounded deque: the oldest entry drops off once the limit is reached
         self.state.action_history.append(log_entry)
-
-        # Keep history manageable
-        if len(self.state.action_history) > 1000:
-            self.state.action_history = self.state.action_history[-500:]
+        self._record_history(log_entry)
 
     def _is_complete(self) -> bool:
         """Check if workflow is complete."""
         # Complete if no pending tasks and no in-progress tasks
-        pending = sum(1 for t in self.state.tasks.values() if t.status in ["pending", "in_progress"])
-        return pending == 0
+        counts = self.state.status_counts
+        return counts["pending"] + counts["in_progress"] == 0
 
     def _finalize_workflow(self) -> bool:
         """Finalize workflow and return completion status."""
@@ -736,61 +1143,60 @@ class OSAManagerAgent:
         actions_taken = 0
 
         while not self._is_complete() and actions_taken < max_actions:
-            # Get current status
-            status = self.actions[ManagerAction.GET_WORKFLOW_STATUS]()
-
             # Select appropriate action (in production, this would use an LLM)
-            action = self._select_action(status)
+            action, args = self._select_action()
 
             # Execute action
             print(f"\n🎬 Action {actions_taken + 1}: {action.value}")
-            result = self.actions[action](status)
+            self._state_changed.clear()
+            result = self.dispatch(action, *args)
 
             actions_taken += 1
 
-            # Brief pause between actions
-            time.sleep(0.1)
+            # Continue at once if the action (or a worker thread) changed the
+            # workflow; otherwise wait briefly for a worker to report progress
+            self._state_changed.wait(timeout=self.IDLE_WAIT_SECONDS)
 
+        counts = self.state.status_counts
         print(f"\n✅ Orchestration complete")
         print(f"   Actions taken: {actions_taken}")
-        print(f"   Tasks completed: {status['completed']}")
-        print(f"   Tasks failed: {status['failed']}")
+        print(f"   Tasks completed: {counts['completed']}")
+        print(f"   Tasks failed: {counts['failed']}")
 
         return self._finalize_workflow()
 
-    def _select_action(self, status: Dict) -> ManagerAction:
+    def _peek_ready(self) -> Optional[Task]:
+        """The task that has been ready longest, or None if nothing can start."""
+        task_id = next(iter(self.state.ready), None)
+        return self.state.tasks[task_id] if task_id is not None else None
+
+    @_synchronized
+    def _select_action(self) -> Tuple[ManagerAction, tuple]:
         """
         Select next action based on current state.
 
         In production, this would use an LLM to select actions.
         For now, use simple heuristics.
-        """
-        pending_count = status["pending"]
 
-        if pending_count > 0:
-            # Have pending tasks - assign them
-            ready_tasks = [t for t in self.state.tasks.values()
-                          if t.status == "pending" and
-                          all(self.state.tasks.get(d, Task(id="", name="")).status == "completed"
-                              for d in t.dependencies)]
-
-            if ready_tasks:
-                # Assign a ready task
-                task = ready_tasks[0]
+        Returns:
+            The action and the arguments to dispatch it with
+        """
+        # Read the live counters; no status snapshot is needed to decide
+        if self.state.status_counts["pending"] > 0:
+            # Have pending tasks - assign the front of the ready set
+            task = self._peek_ready()
 
+            if task is not None:
                 # Select appropriate agent based on task content
                 agent_id = self._select_agent_for_task(task)
-                return ManagerAction.ASSIGN_TASK
+                return ManagerAction.ASSIGN_TASK, (task.id, agent_id)
 
-        return ManagerAction.GET_WORKFLOW_STATUS
+        return ManagerAction.GET_WORKFLOW_STATUS, ()
 
     def _select_agent_for_task(self, task: Task) -> str:
         """Select appropriate agent for a task based on content."""
-        desc_lower = task.description.lower()
-
         # Use role detection from registry
-        from .role_detection import detect_role
-        role = detect_role(task.description)
+        role = _cached_detect_role(task.description)
         return get_agent_for_role(role, list(self.state.agents.keys()))
 
 
@@ -812,11 +1218,34 @@ def create_manager(goal: str, state_file: Optional[str] = None) -> OSAManagerAge
     return OSAManagerAgent(goal=goal, state_file=state_file)
 
 
+def format_state_file(state_file: str) -> str:
+    """
+    Pretty-print a saved state file for humans.
+
+    State is saved as compact JSON to keep saves fast; this re-indents it.
+
+    Args:
+        state_file: Path to a manager state file
+
+    Returns:
+        The state as indented JSON text
+    """
+    with open(state_file, 'rb') as f:
+        return json.dumps(_decode_state(f.read()), indent=2, ensure_ascii=False)
+
+
 # ============================================================================
 # DEMO / TESTING
 # ============================================================================
 
 if __name__ == "__main__":
+    import sys
+
+    # python -m yolo_mode.agents.manager dump-state [STATE_FILE]
+    if sys.argv[1:2] == ["dump-state"]:
+        print(format_state_file(sys.argv[2] if len(sys.argv) > 2 else ".claude/manager-state.json"))
+        sys.exit(0)
+
     # Demo: Create manager and orchestrate a simple workflow
     print("=== OSA Manager Agent Demo ===\n")
 
@@ -847,21 +1276,21 @@ if __name__ == "__main__":
     )
 
     # Show workflow status
-    status = manager.actions[ManagerAction.GET_WORKFLOW_STATUS]()
+    status = manager.dispatch(ManagerAction.GET_WORKFLOW_STATUS)
     print(f"\n📊 Initial Status:")
     print(f"   Total tasks: {status['total_tasks']}")
     print(f"   Pending: {status['pending']}")
     print(f"   In progress: {status['in_progress']}")
 
     # Show available agents
-    agents = manager.actions[ManagerAction.GET_AVAILABLE_AGENTS]()
+    agents = manager.dispatch(ManagerAction.GET_AVAILABLE_AGENTS)
     print(f"\n🤖 Available Agents:")
     for agent_id, info in agents.items():
         print(f"   {agent_id}: {info['name']}")
         print(f"      Capabilities: {', '.join(info['capabilities'][:3])}...")
 
     # Show pending tasks
-    pending = manager.actions[ManagerAction.GET_PENDING_TASKS]()
+    pending = manager.dispatch(ManagerAction.GET_PENDING_TASKS)
     print(f"\n📋 Pending Tasks:")
     for task in pending:
         ready = "✓" if task["can_start"] else "✗"
@@ -13,6 +13,22 @@ class MiniSweResult:
     error: Optional[str] = None
     model_used: str = ""
 
+# (DefaultAgent, LitellmModel, LocalEnvironment) once imported, False if the import failed,
+# None if not tried yet. A failed import is not cached by Python, so remembering it avoids
+# a path search per task.
+_MINI_API = None
+
+def _get_mini():
+    """Return minisweagent's (DefaultAgent, LitellmModel, LocalEnvironment), or None if unavailable."""
+    global _MINI_API
+    if _MINI_API is None:
+        try:
+            from minisweagent import DefaultAgent, LitellmModel, LocalEnvironment
+            _MINI_API = (DefaultAgent, LitellmModel, LocalEnvironment)
+        except (ImportError, AttributeError):
+            _MINI_API = False
+    return _MINI_API or None
+
 class MiniSweAgentRunner:
     """Runner for mini-swe-agent."""
     
@@ -23,8 +39,12 @@ class MiniSweAgentRunner:
     
     def run(self, task: str) -> MiniSweResult:
         """Run mini-swe-agent on a task."""
+        mini = _get_mini()
+        if mini is None:
+            return self._run_cli(task)
+        DefaultAgent, LitellmModel, LocalEnvironment = mini
         try:
-            from minisweagent import DefaultAgent, LitellmModel, LocalEnvironment
+            # A fresh model per task; it tracks its own cost and call counts
             model = LitellmModel(model_name=self.model_name)
             env = LocalEnvironment(timeout=self.timeout)
             agent = DefaultAgent(model, env)
@@ -54,12 +74,10 @@ def run_mini_swe_agent(task: str, model: str = "minimax/minimax-m2.5", timeout:
 
 def is_mini_available() -> bool:
     """Check if mini-swe-agent is available."""
-    try:
-        from minisweagent import DefaultAgent
+    if _get_mini() is not None:
         return True
-    except ImportError:
-        try:
-            result = subprocess.run(["mini", "--help"], capture_output=True, timeout=5)
-            return result.returncode == 0
-        except Exception:
-            return False
+    try:
+        result = subprocess.run(["mini", "--help"], capture_output=True, timeout=5)
+        return result.returncode == 0
+    except Exception:
+        return False
@@ -8,22 +8,70 @@ Based on Agent Contracts framework (arXiv:2601.08815, January 2025)
 which ensures child contracts respect parent budget constraints.
 """
 
+import functools
+import itertools
+import logging
+import multiprocessing
 import time
-from typing import List, Dict, Set, Optional, Callable, Any, Tuple
+from collections import deque
+from typing import List, Dict, Deque, Set, Optional, Callable, Any, Iterator, Tuple
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from threading import Lock
 
 # Import OSA components
+from ._compat import DATACLASS_SLOTS
 from .registry import AGENT_REGISTRY, OSARole, AgentConfig
 from ..contracts import AgentContract, ResourceDimension, ConservationEnforcer
 
+log = logging.getLogger(__name__)
+
+# runner module once imported. It is imported on first use to avoid a circular
+# import; run_agent is looked up on the module at call time so patches still apply.
+_RUNNER_MODULE = None
+
+def _get_runner():
+    """Return the runner module, importing it on first use."""
+    global _RUNNER_MODULE
+    if _RUNNER_MODULE is None:
+        from . import runner
+        _RUNNER_MODULE = runner
+    return _RUNNER_MODULE
+
+
+def _run_agent_in_process(agent: str, task: str) -> Any:
+    """Run an agent in a worker process; module-level so it can be pickled."""
+    return _get_runner().run_agent(agent, task, verbose=False)
+
+
+def _default_agent_selector(task: str) -> str:
+    """Agent used when execute_batch is given no selector."""
+    return "claude"
+
+
+@functools.lru_cache(maxsize=256)
+def _estimate_resources(task: str) -> Tuple[int, float, int]:
+    """
+    Estimate (tokens, time, iterations) for a task description.
+
+    Cached per description, so retried or repeated tasks are estimated
+    once. Returns a tuple because cached values must not be mutable.
+    """
+    # Rough word count from separators, without building a list of words
+    words = task.count(" ") + task.count("\n") + 1 if task else 0
+
+    return (
+        words * 50,  # Rough estimate
+        min(words * 0.5, 120),  # Cap at 2 minutes
+        1
+    )
+
 
 # ============================================================================
 # TASK EXECUTION RESULT
 # ============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TaskResult:
     """Result of executing a task."""
     task_id: str
@@ -49,12 +97,18 @@ class ContractAwareExecutor:
     - Conservation law enforcement across all parallel tasks
     - Dynamic batching based on remaining resources
     - Intelligent agent assignment for parallel execution
+
+    Workers only build and return TaskResults. The thread that called
+    execute_batch is the single consumer of their futures and the only
+    one to append to execution_history, so it needs no lock. Batches
+    are driven from one thread at a time.
     """
 
     def __init__(
         self,
         contract: Optional[AgentContract] = None,
-        max_workers: int = 3
+        max_workers: int = 3,
+        use_processes: bool = False
     ):
         """
         Initialize parallel executor.
@@ -62,21 +116,125 @@ class ContractAwareExecutor:
         Args:
             contract: Parent contract for resource governance
             max_workers: Maximum parallel workers (default: 3)
+            use_processes: Run agent calls in worker processes, for
+                agents doing CPU-bound Python work that would hold the GIL
         """
         self.contract = contract
         self.max_workers = max_workers
+        self.use_processes = use_processes
 
         # Create conservation enforcer if contract provided
         self.conservation = ConservationEnforcer(contract) if contract else None
 
-        # Track completed tasks
-        self.completed_tasks: Set[str] = set()
-        self.failed_tasks: Set[str] = set()
+        # Track executed tasks (appended by the driving thread only)
         self.execution_history: List[TaskResult] = []
 
-        # Thread-safe tracking
+        # Running totals for get_execution_stats, updated by _record_result
+        self._stat_success = 0
+        self._stat_time_sum = 0.0
+        self._stat_success_time_sum = 0.0
+        self._agent_usage: Dict[str, int] = {}
+
+        # Guards creating and closing the worker pool
         self._lock = Lock()
 
+        # Task ids; next() on a count is atomic, so workers need no lock
+        self._task_counter = itertools.count()
+
+        # Worker pool shared by every batch, created on first use
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # Process pool for agent calls when use_processes is set
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+        # Finished child contracts, reset and reused by later batches
+        self._contract_pool: Deque[AgentContract] = deque(maxlen=64)
+
+    def __enter__(self) -> "ContractAwareExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # Don't block garbage collection on running tasks; close() waits
+        for name in ("_pool", "_process_pool"):
+            pool = getattr(self, name, None)
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+    def close(self):
+        """Shut down the worker pools, waiting for submitted tasks to finish."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            process_pool, self._process_pool = self._process_pool, None
+        # Threads first: they may still be waiting on agent processes
+        if pool is not None:
+            pool.shutdown(wait=True)
+        if process_pool is not None:
+            process_pool.shutdown(wait=True)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        Return the shared worker pool, creating it on first use.
+
+        One pool of max_workers threads serves every batch without
+        re-spawning threads; tasks beyond that queue until a thread frees.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="yolo-executor"
+                )
+            return self._pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the agent process pool, creating it on first use.
+
+        Processes are spawned rather than forked: the pool is created
+        while worker threads are running, and forking a threaded
+        process can deadlock the child.
+        """
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._process_pool
+
+    def _run_agent(self, agent: str, task: str) -> Any:
+        """
+        Run one agent call, in a worker process if use_processes is set.
+
+        Only the agent call crosses the process boundary; contracts,
+        task ids and results stay in this process. The calling worker
+        thread waits on the result with the GIL released.
+        """
+        if self.use_processes:
+            return self._get_process_pool().submit(_run_agent_in_process, agent, task).result()
+        return _get_runner().run_agent(agent, task, verbose=False)
+
+    def _submit(self, fn: Callable, *args, inline: bool = False) -> Future:
+        """
+        Start fn(*args) on the worker pool, or run it now if inline.
+
+        Batches run their last task inline: the calling thread would
+        otherwise only wait on the others, and a batch of one never has
+        to touch the pool. Inline results come back as an already
+        finished Future, so callers collect them like any other.
+        """
+        if not inline:
+            return self._get_pool().submit(fn, *args)
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
     def execute_batch(
         self,
         tasks: List[str],
@@ -92,47 +250,57 @@ class ContractAwareExecutor:
         Returns:
             List of TaskResult objects
         """
+        # Resolve the default once so per-task dispatch just calls it
+        agent_selector = agent_selector or _default_agent_selector
+
         if not self.contract:
             # No contract - simple parallel execution
             return self._execute_simple_parallel(tasks, agent_selector)
 
-        # Contract-aware execution
-        batches = self._plan_contract_aware_batches(tasks)
-
+        # Contract-aware execution; each batch is sized from the
+        # utilization left after the batches before it
         all_results = []
-
-        for batch_num, batch in enumerate(batches, 1):
-            print(f"\n📦 Executing Batch {batch_num}/{len(batches)} ({len(batch)} tasks)")
-
-            # Create child contracts for this batch
-            child_contracts = self._allocate_batch_contracts(len(batch))
-
-            # Execute batch with child contracts
-            batch_results = self._execute_batch_with_contracts(
-                batch,
-                child_contracts,
-                agent_selector
-            )
+        remaining = len(tasks)
+
+        for batch_num, batch in enumerate(self._iter_contract_aware_batches(tasks), 1):
+            remaining -= len(batch)
+            log.info("Executing batch %d (%d tasks, %d queued)", batch_num, len(batch), remaining)
+
+            # Check the parent once per batch; workers still check their own contracts
+            can_proceed, reason = self.contract.can_proceed()
+            if can_proceed:
+                # Create child contracts for this batch
+                child_contracts = self._allocate_batch_contracts(len(batch))
+
+                # Execute batch with child contracts
+                batch_results = self._execute_batch_with_contracts(
+                    batch,
+                    child_contracts,
+                    agent_selector
+                )
+            else:
+                batch_results = self._reject_batch(batch, f"Parent contract: {reason}")
 
             all_results.extend(batch_results)
 
-            # Report batch results
-            completed = sum(1 for r in batch_results if r.success)
-            print(f"   Batch {batch_num}: {completed}/{len(batch)} tasks completed")
+            # Report batch results; skip the count when nobody is listening
+            if log.isEnabledFor(logging.INFO):
+                completed = sum(1 for r in batch_results if r.success)
+                log.info("Batch %d: %d/%d tasks completed", batch_num, completed, len(batch))
 
         return all_results
 
     def _execute_simple_parallel(
         self,
         tasks: List[str],
-        agent_selector: Optional[Callable[[str], str]]
+        agent_selector: Callable[[str], str]
     ) -> List[TaskResult]:
         """
         Execute tasks in parallel without contract constraints.
 
         Args:
             tasks: List of task descriptions
-            agent_selector: Optional agent selector function
+            agent_selector: Picks the agent for each task
 
         Returns:
             List of TaskResult objects
@@ -140,90 +308,122 @@ class ContractAwareExecutor:
         results = []
         available_agents = list(AGENT_REGISTRY.keys())
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_task = {}
-            for task_id, task in enumerate(tasks):
-                agent = agent_selector(task) if agent_selector else "claude"
-                future = executor.submit(self._execute_single_task, task, agent)
-                future_to_task[future] = (task_id, task)
-
-            # Collect results as they complete
-            for future in as_completed(future_to_task.keys()):
+        # Submit all tasks. The last one runs on this thread only if every
+        # task gets a worker; otherwise the pool's threads plus this one
+        # would exceed max_workers, so it queues like the rest.
+        future_to_task = {}
+        last = len(tasks) - 1 if len(tasks) <= self.max_workers else -1
+        for task_id, task in enumerate(tasks):
+            agent = agent_selector(task)
+            future = self._submit(self._execute_single_task, task, agent, inline=task_id == last)
+            future_to_task[future] = (task_id, task)
+
+        # Collect results as they complete
+        pending = set(future_to_task)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
                 task_id, task = future_to_task[future]
                 try:
                     result = future.result()
-                    results.append(result)
                 except Exception as e:
-                    results.append(TaskResult(
-                        task_id=f"task_{task_id}",
+                    result = TaskResult(
+                        task_id=f"task_{next(self._task_counter)}",
                         task_description=task,
                         success=False,
                         error=str(e)
-                    ))
+                    )
+                results.append(result)
+                self._record_result(result)
 
         return results
 
-    def _plan_contract_aware_batches(self, tasks: List[str]) -> List[List[str]]:
+    def _record_result(self, result: TaskResult):
+        """Add a collected result to the executor's tracking."""
+        self.execution_history.append(result)
+
+        self._stat_time_sum += result.execution_time
+        if result.success:
+            self._stat_success += 1
+            self._stat_success_time_sum += result.execution_time
+        if result.agent_used:
+            self._agent_usage[result.agent_used] = self._agent_usage.get(result.agent_used, 0) + 1
+
+    @property
+    def completed_tasks(self) -> Set[str]:
+        """Ids of successful tasks, derived from execution_history."""
+        return {r.task_id for r in self.execution_history if r.success}
+
+    @property
+    def failed_tasks(self) -> Set[str]:
+        """Ids of failed tasks, derived from execution_history."""
+        return {r.task_id for r in self.execution_history if not r.success}
+
+    def _iter_contract_aware_batches(self, tasks: List[str]) -> Iterator[List[str]]:
         """
-        Plan execution batches respecting conservation laws.
+        Yield execution batches respecting conservation laws.
 
-        Creates batches where each batch has a child contract
-        with allocated resources that sum to ≤ parent budget.
+        Each batch gets child contracts whose allocated resources sum to
+        ≤ parent budget. Batch size follows the parent's remaining
+        budget, max(1, max_workers * (1 - max_utilization)), and is
+        recomputed before every batch. Batches are yielded lazily and
+        finished children are released to the parent, so each size
+        reflects what the previous batches consumed.
 
         Args:
             tasks: List of pending tasks
 
-        Returns:
-            List of task batches
+        Yields:
+            Task batches, in order
         """
         if not self.contract or not self.conservation:
             # No contract - single batch with all tasks
-            return [tasks]
-
-        batches = []
-        current_batch = []
-
-        # Get parent contract status
-        status = self.contract.get_status()
-        max_util = status["max_utilization"]
-
-        # Adjust batch size based on utilization
-        if max_util > 0.8:
-            # High utilization - smaller batches
-            target_batch_size = 1
-        elif max_util > 0.5:
-            # Medium utilization - medium batches
-            target_batch_size = 2
-        else:
-            # Low utilization - larger batches
-            target_batch_size = min(self.max_workers, 3)
+            if tasks:
+                yield list(tasks)
+            return
 
-        for task in tasks:
-            # Estimate task resources
-            estimated = self._estimate_task_resources(task)
+        next_task = 0
+        while next_task < len(tasks):
+            # Re-read parent utilization for every batch
+            max_util = self.contract.get_status()["max_utilization"]
+            target_batch_size = max(1, int(self.max_workers * (1 - max_util)))
 
-            # Check if we can add to current batch
-            if self._can_add_to_batch(current_batch, estimated):
-                current_batch.append(task)
-            else:
-                # Start new batch
-                if current_batch:
-                    batches.append(current_batch)
-                current_batch = [task]
+            # A batch always takes at least one task
+            batch = [tasks[next_task]]
+            next_task += 1
+            while next_task < len(tasks) and self._can_add_to_batch(
+                batch,
+                self._estimate_task_resources(tasks[next_task]),
+                target_batch_size
+            ):
+                batch.append(tasks[next_task])
+                next_task += 1
 
-        # Don't forget the last batch
-        if current_batch:
-            batches.append(current_batch)
+            yield batch
 
-        return batches
+    def _reject_batch(self, batch: List[str], error: str) -> List[TaskResult]:
+        """Record every task in batch as failed without running it."""
+        results = []
+        for task in batch:
+            result = TaskResult(
+                task_id=f"task_{next(self._task_counter)}",
+                task_description=task,
+                success=False,
+                error=error
+            )
+            results.append(result)
+            self._record_result(result)
+        return results
 
     def _allocate_batch_contracts(self, batch_size: int) -> List[AgentContract]:
         """
         Allocate child contracts for a batch of tasks.
 
         Each child contract gets a portion of parent resources
-        following conservation laws.
+        following conservation laws. Contracts returned to the pool by
+        earlier batches are reset with a fresh share of the parent's
+        remaining budget and reused before new ones are made; any that
+        will not re-activate are dropped.
 
         Args:
             batch_size: Number of tasks in the batch
@@ -236,8 +436,14 @@ class ContractAwareExecutor:
 
         contracts = []
         for _ in range(batch_size):
-            child = self.conservation.create_child_contract()
-            child.activate()
+            child = None
+            while self._contract_pool and child is None:
+                candidate = self._contract_pool.pop()
+                if candidate.reset(self.conservation.allocate_child_budget()):
+                    child = candidate
+            if child is None:
+                child = self.conservation.create_child_contract()
+                child.activate()
             contracts.append(child)
 
         return contracts
@@ -246,7 +452,7 @@ class ContractAwareExecutor:
         self,
         batch: List[str],
         child_contracts: List[AgentContract],
-        agent_selector: Optional[Callable[[str], str]]
+        agent_selector: Callable[[str], str]
     ) -> List[TaskResult]:
         """
         Execute a batch of tasks with their assigned child contracts.
@@ -254,7 +460,7 @@ class ContractAwareExecutor:
         Args:
             batch: List of task descriptions
             child_contracts: Child contracts for each task
-            agent_selector: Optional agent selector function
+            agent_selector: Picks the agent for each task
 
         Returns:
             List of TaskResult objects
@@ -262,24 +468,34 @@ class ContractAwareExecutor:
         results = []
 
         # Execute tasks in parallel with their contracts
-        with ThreadPoolExecutor(max_workers=len(batch)) as executor:
-            future_to_task = {}
-
-            for i, (task, contract) in enumerate(zip(batch, child_contracts)):
-                # Select agent for this task
-                agent = agent_selector(task) if agent_selector else "claude"
-
-                # Submit execution
-                future = executor.submit(
-                    self._execute_with_contract,
-                    task,
-                    agent,
-                    contract
-                )
-                future_to_task[future] = (i, task, contract)
-
-            # Collect results
-            for future in as_completed(future_to_task.keys()):
+        future_to_task = {}
+        # Tasks and contracts pair up by index; a short contract list
+        # limits the batch, as zip() did
+        count = min(len(batch), len(child_contracts))
+
+        for i in range(count):
+            task = batch[i]
+            contract = child_contracts[i]
+
+            # Select agent for this task
+            agent = agent_selector(task)
+
+            # Submit execution; the last task runs on this thread
+            future = self._submit(
+                self._execute_with_contract,
+                task,
+                agent,
+                contract,
+                inline=i == count - 1
+            )
+            future_to_task[future] = (i, task, contract)
+
+        # Collect results; batches are small, so wake once per
+        # completion pass rather than once per future
+        pending = set(future_to_task)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
                 idx, task, contract = future_to_task[future]
                 try:
                     result = future.result()
@@ -290,15 +506,19 @@ class ContractAwareExecutor:
                     else:
                         contract.terminate("task_failed")
 
-                    results.append(result)
-
                 except Exception as e:
-                    results.append(TaskResult(
-                        task_id=f"task_{idx}",
+                    result = TaskResult(
+                        task_id=f"task_{next(self._task_counter)}",
                         task_description=task,
                         success=False,
                         error=str(e)
-                    ))
+                    )
+                results.append(result)
+                self._record_result(result)
+
+                # Hand the contract's usage to the parent, then recycle it
+                if self.conservation.release_child(contract):
+                    self._contract_pool.append(contract)
 
         return results
 
@@ -320,34 +540,38 @@ class ContractAwareExecutor:
             TaskResult with resource tracking
         """
         start_time = time.time()
+        task_id = f"task_{next(self._task_counter)}"
 
         # Check if contract allows proceeding
         can_proceed, reason = contract.can_proceed()
         if not can_proceed:
             return TaskResult(
-                task_id=f"task_{hash(task)}",
+                task_id=task_id,
                 task_description=task,
                 success=False,
                 agent_used=agent,
                 error=f"Contract constraint: {reason}"
             )
 
-        # Import runner here to avoid circular imports
-        from .runner import run_agent
-
         # Execute the task
         try:
-            output = run_agent(agent, task, verbose=False)
-
-            # Consume resources
-            estimated_tokens = len(str(output)) // 4 if output else 0
+            output = self._run_agent(agent, task)
+
+            # Consume resources; run_agent returns a str, so only other
+            # output types pay for building a repr
+            if isinstance(output, (str, bytes)):
+                estimated_tokens = len(output) // 4
+            elif output is None:
+                estimated_tokens = 0
+            else:
+                estimated_tokens = len(repr(output)) // 4
             contract.consume_resource(ResourceDimension.TOKENS, estimated_tokens)
             contract.consume_resource(ResourceDimension.ITERATIONS, 1)
 
             execution_time = time.time() - start_time
 
             return TaskResult(
-                task_id=f"task_{hash(task)}",
+                task_id=task_id,
                 task_description=task,
                 success=True,
                 output=output,
@@ -363,7 +587,7 @@ class ContractAwareExecutor:
         except Exception as e:
             contract.terminate(f"execution_error: {str(e)}")
             return TaskResult(
-                task_id=f"task_{hash(task)}",
+                task_id=task_id,
                 task_description=task,
                 success=False,
                 agent_used=agent,
@@ -374,13 +598,12 @@ class ContractAwareExecutor:
     def _execute_single_task(self, task: str, agent: str) -> TaskResult:
         """Execute a single task without contract tracking."""
         start_time = time.time()
-
-        from .runner import run_agent
+        task_id = f"task_{next(self._task_counter)}"
 
         try:
-            output = run_agent(agent, task, verbose=False)
+            output = self._run_agent(agent, task)
             return TaskResult(
-                task_id=f"task_{hash(task)}",
+                task_id=task_id,
                 task_description=task,
                 success=True,
                 output=output,
@@ -389,7 +612,7 @@ class ContractAwareExecutor:
             )
         except Exception as e:
             return TaskResult(
-                task_id=f"task_{hash(task)}",
+                task_id=task_id,
                 task_description=task,
                 success=False,
                 agent_used=agent,
@@ -406,35 +629,29 @@ class ContractAwareExecutor:
         Returns:
             Dictionary with estimated resource requirements
         """
-        # Simple heuristic based on task complexity
-        words = len(task.split())
+        tokens, seconds, iterations = _estimate_resources(task)
+        return {"tokens": tokens, "time": seconds, "iterations": iterations}
 
-        return {
-            "tokens": words * 50,  # Rough estimate
-            "time": min(words * 0.5, 120),  # Cap at 2 minutes
-            "iterations": 1
-        }
-
-    def _can_add_to_batch(self, batch: List[str], estimate: Dict) -> bool:
+    def _can_add_to_batch(
+        self,
+        batch: List[str],
+        estimate: Dict,
+        target_batch_size: Optional[int] = None
+    ) -> bool:
         """
         Check if task can be added to current batch.
 
         Args:
             batch: Current batch tasks
             estimate: Estimated resources for new task
+            target_batch_size: Batch size to stop at (default: max_workers)
 
         Returns:
             True if task fits in batch
         """
-        if len(batch) >= self.max_workers:
-            return False
-
-        if not self.contract:
-            return True
-
-        # Check contract constraints
-        can_proceed, _ = self.contract.can_proceed()
-        return can_proceed
+        # The parent contract is checked once per batch by execute_batch
+        limit = self.max_workers if target_batch_size is None else min(target_batch_size, self.max_workers)
+        return len(batch) < limit
 
     def get_execution_stats(self) -> Dict:
         """
@@ -446,28 +663,19 @@ class ContractAwareExecutor:
         if not self.execution_history:
             return {"message": "No executions yet"}
 
+        # Read the running totals kept by _record_result
         total = len(self.execution_history)
-        successful = sum(1 for r in self.execution_history if r.success)
-        failed = total - successful
-
-        # Calculate average execution time
-        times = [r.execution_time for r in self.execution_history if r.success]
-        avg_time = sum(times) / len(times) if times else 0
-
-        # Agent usage
-        agent_usage = {}
-        for result in self.execution_history:
-            if result.agent_used:
-                agent_usage[result.agent_used] = agent_usage.get(result.agent_used, 0) + 1
+        successful = self._stat_success
 
         return {
             "total_executions": total,
             "successful": successful,
-            "failed": failed,
-            "success_rate": successful / total if total > 0 else 0,
-            "average_execution_time": avg_time,
-            "agent_usage": agent_usage,
-            "total_execution_time": sum(r.execution_time for r in self.execution_history)
+            "failed": total - successful,
+            "success_rate": successful / total,
+            # Average over successful tasks only
+            "average_execution_time": self._stat_success_time_sum / successful if successful else 0,
+            "agent_usage": dict(self._agent_usage),
+            "total_execution_time": self._stat_time_sum
         }
 
     def print_stats(self):
@@ -497,7 +705,8 @@ class ContractAwareExecutor:
 
 def create_executor(
     contract: Optional[AgentContract] = None,
-    max_workers: int = 3
+    max_workers: int = 3,
+    use_processes: bool = False
 ) -> ContractAwareExecutor:
     """
     Factory function to create parallel executor.
@@ -505,11 +714,16 @@ def create_executor(
     Args:
         contract: Optional contract for resource governance
         max_workers: Maximum parallel workers
+        use_processes: Run agent calls in worker processes
 
     Returns:
         Configured executor instance
     """
-    return ContractAwareExecutor(contract=contract, max_workers=max_workers)
+    return ContractAwareExecutor(
+        contract=contract,
+        max_workers=max_workers,
+        use_processes=use_processes
+    )
 
 
 # ============================================================================
@@ -520,6 +734,9 @@ if __name__ == "__main__":
     # Demo: Create executor and run parallel tasks
     print("=== Contract-Aware Parallel Executor Demo ===\n")
 
+    # Show batch progress from the executor's logger
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     from ..contracts import ContractFactory
 
     # Create a contract
@@ -554,3 +771,4 @@ if __name__ == "__main__":
 
     # Show stats
     executor.print_stats()
+    executor.close()
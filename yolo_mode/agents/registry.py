@@ -9,9 +9,12 @@ Based on research from:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
+
 
 # ============================================================================
 # ENUMERATIONS
@@ -46,21 +49,39 @@ class OSARole(Enum):
 # AGENT CONFIGURATION
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AgentConfig:
-    """Configuration for a CLI agent."""
+    """
+    Configuration for a CLI agent.
+
+    Read-only once built: lists, sets and dicts passed in are stored as
+    tuples, frozensets and a read-only mapping, so configs can be shared
+    across threads and hashed.
+    """
     name: str                          # Display name
     cli_command: str                    # Command to invoke
     yolo_flag: str = "--yolo"          # YOLO mode flag
     subcommand: Optional[str] = None     # Subcommand if needed (e.g., "run")
     prompt_position: str = "last"        # Where prompt goes: "last" or flag name
     model_flag: Optional[str] = None     # Flag for model selection
-    preferred_models: List[str] = field(default_factory=list)
-    osa_roles: Set[OSARole] = field(default_factory=set)
-    capabilities: Set[AgentCapability] = field(default_factory=set)
-    env_vars: Dict[str, str] = field(default_factory=dict)  # Required env vars
+    preferred_models: Tuple[str, ...] = ()
+    osa_roles: FrozenSet[OSARole] = frozenset()
+    capabilities: FrozenSet[AgentCapability] = frozenset()
+    # Required env vars; left out of the hash since mappings aren't hashable
+    env_vars: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}), hash=False)
     priority: int = 99                 # Selection priority (lower = preferred)
     description: str = ""                # Human-readable description
+    # Role values for display, derived from osa_roles when constructed
+    role_names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen: fields can only be set through object.__setattr__ here
+        set_field = object.__setattr__
+        set_field(self, "preferred_models", tuple(self.preferred_models))
+        set_field(self, "osa_roles", frozenset(self.osa_roles))
+        set_field(self, "capabilities", frozenset(self.capabilities))
+        set_field(self, "env_vars", MappingProxyType(dict(self.env_vars)))
+        set_field(self, "role_names", tuple(sorted(role.value for role in self.osa_roles)))
 
 
 # ============================================================================
@@ -180,6 +201,24 @@ AGENT_REGISTRY: Dict[str, AgentConfig] = {
 }
 
 
+def _build_index(members) -> Dict:
+    """
+    Map each role or capability to the agents having it, best first
+    (priority, then registry order). `members` picks the set to index.
+    """
+    index: Dict = {}
+    for name, config in sorted(AGENT_REGISTRY.items(), key=lambda item: item[1].priority):
+        for key in members(config):
+            index.setdefault(key, []).append(name)
+    return {key: tuple(names) for key, names in index.items()}
+
+
+# Built once at import: the registry is static, and these lookups are on the
+# hot path of every task routed by a long manager run.
+_ROLE_TO_AGENTS: Dict[OSARole, tuple] = _build_index(lambda config: config.osa_roles)
+_CAPABILITY_TO_AGENTS: Dict[AgentCapability, tuple] = _build_index(lambda config: config.capabilities)
+
+
 # ============================================================================
 # AGENT SELECTION FUNCTIONS
 # ============================================================================
@@ -195,22 +234,16 @@ def get_agent_for_role(role: OSARole, available: List[str] = None) -> str:
     Returns:
         Agent name that best supports the given role
     """
-    available = available or list(AGENT_REGISTRY.keys())
-
-    # Filter agents that support this role
-    candidates = [
-        (name, config)
-        for name, config in AGENT_REGISTRY.items()
-        if name in available and role in config.osa_roles
-    ]
+    if not available:
+        available = list(AGENT_REGISTRY.keys())
+    available_set = frozenset(available)
 
-    if not candidates:
+    # _ROLE_TO_AGENTS is already sorted by priority (lower = preferred)
+    agent = next((name for name in _ROLE_TO_AGENTS.get(role, ()) if name in available_set), None)
+    if agent is None:
         # Fallback: return first available
         return available[0] if available else "claude"
-
-    # Sort by priority (lower = preferred)
-    candidates.sort(key=lambda x: x[1].priority)
-    return candidates[0][0]
+    return agent
 
 
 def get_agent_for_capability(capability: AgentCapability, available: List[str] = None) -> str:
@@ -222,16 +255,17 @@ def get_agent_for_capability(capability: AgentCapability, available: List[str] =
         available: List of available agent names
 
     Returns:
-        Agent name that supports the capability
+        Best-priority available agent that supports the capability
     """
-    available = available or list(AGENT_REGISTRY.keys())
-
-    for agent_name in available:
-        agent = AGENT_REGISTRY.get(agent_name)
-        if agent and capability in agent.capabilities:
-            return agent_name
+    if not available:
+        available = list(AGENT_REGISTRY.keys())
+    available_set = frozenset(available)
 
-    return available[0] if available else "claude"
+    # _CAPABILITY_TO_AGENTS is already sorted by priority (lower = preferred)
+    agent = next((name for name in _CAPABILITY_TO_AGENTS.get(capability, ()) if name in available_set), None)
+    if agent is None:
+        return available[0] if available else "claude"
+    return agent
 
 
 def get_all_agents() -> List[str]:
@@ -279,7 +313,7 @@ def print_registry_summary():
     for name, config in AGENT_REGISTRY.items():
         print(f"  {name} (priority {config.priority})")
         print(f"    Description: {config.description}")
-        print(f"    OSA Roles: {', '.join(r.value for r in config.osa_roles)}")
+        print(f"    OSA Roles: {', '.join(config.role_names)}")
         print(f"    Capabilities: {', '.join(c.value for c in config.capabilities)}")
         print(f"    CLI: {config.cli_command}")
         print()
@@ -14,8 +14,9 @@ Selection Logic:
 - Default → Role-based selection
 """
 
+import functools
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from .registry import (
     AGENT_REGISTRY,
     OSARole,
@@ -80,6 +81,14 @@ QUALITY_RANKING = ["claude", "gemini", "qwen", "crush", "opencode"]
 EFFICIENCY_RANKING = ["qwen", "crush", "opencode", "gemini", "claude"]
 
 
+def _first_ranked(ranking: List[str], available: List[str], available_set: FrozenSet[str]) -> str:
+    """Return the best-ranked available agent, else the first available."""
+    agent = next((name for name in ranking if name in available_set), None)
+    if agent is None:
+        return available[0] if available else "claude"
+    return agent
+
+
 # ============================================================================
 # RESOURCE-AWARE SELECTION
 # ============================================================================
@@ -102,6 +111,17 @@ class ResourceAwareSelector:
         self.contract = contract
         self.selection_history: List[Dict] = []
 
+        # Timestamp shared by selections made between begin_batch and end_batch
+        self._batch_ts: Optional[float] = None
+
+    def begin_batch(self):
+        """Stamp every selection until end_batch() with one clock reading."""
+        self._batch_ts = time.time()
+
+    def end_batch(self):
+        """Go back to timestamping each selection separately."""
+        self._batch_ts = None
+
     def select_agent(
         self,
         task: str,
@@ -119,9 +139,49 @@ class ResourceAwareSelector:
         Returns:
             Tuple of (agent_name, reasoning)
         """
-        # Get contract status if available
-        if self.contract:
-            status = self.contract.get_status()
+        status = self.contract.get_status() if self.contract else None
+        return self._select_agent(task, available_agents, frozenset(available_agents), status, role_override)
+
+    def select_agent_batch(
+        self,
+        tasks: List[str],
+        available_agents: List[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Select agents for several tasks against one contract snapshot.
+
+        Selecting consumes nothing, so the contract status is read once
+        for the whole batch instead of once per task. The selections
+        share one timestamp in selection_history.
+
+        Args:
+            tasks: Task descriptions
+            available_agents: Available agent names
+
+        Returns:
+            (agent_name, reasoning) for each task, in order
+        """
+        status = self.contract.get_status() if self.contract else None
+        available_set = frozenset(available_agents)
+        self.begin_batch()
+        try:
+            return [
+                self._select_agent(task, available_agents, available_set, status)
+                for task in tasks
+            ]
+        finally:
+            self.end_batch()
+
+    def _select_agent(
+        self,
+        task: str,
+        available_agents: List[str],
+        available_set: FrozenSet[str],
+        status: Optional[Dict],
+        role_override: Optional[OSARole] = None
+    ) -> Tuple[str, str]:
+        """select_agent() against a given contract status (None without a contract)."""
+        if status is not None:
             max_util = status["max_utilization"]
             time_remaining = status["time_remaining"]
         else:
@@ -140,34 +200,34 @@ class ResourceAwareSelector:
 
         # Urgent mode or low time: prioritize speed
         if self.contract and self.contract.mode == ContractMode.URGENT:
-            agent = self._select_by_speed(available_agents)
+            agent = self._select_by_speed(available_agents, available_set)
             reasoning += f" → Urgent: {agent} (fast)"
             self._track_selection(task, agent, "urgent")
             return agent, reasoning
 
         if time_remaining < 30:
-            agent = self._select_by_speed(available_agents)
+            agent = self._select_by_speed(available_agents, available_set)
             reasoning += f" → Low time: {agent} (fast)"
             self._track_selection(task, agent, "time_constraint")
             return agent, reasoning
 
         # High utilization: prioritize efficiency
         if max_util > 0.8:
-            agent = self._select_by_efficiency(available_agents)
+            agent = self._select_by_efficiency(available_agents, available_set)
             reasoning += f" → High utilization ({max_util*100:.0f}%): {agent} (efficient)"
             self._track_selection(task, agent, "resource_constraint")
             return agent, reasoning
 
         # Medium utilization: balanced approach
         if max_util > 0.5:
-            agent = self._select_by_cost(available_agents)
+            agent = self._select_by_cost(available_agents, available_set)
             reasoning += f" → Medium utilization: {agent} (cost-effective)"
             self._track_selection(task, agent, "balanced")
             return agent, reasoning
 
         # Low utilization: prioritize quality
         if max_util < 0.5:
-            agent = self._select_by_quality(available_agents)
+            agent = self._select_by_quality(available_agents, available_set)
             reasoning += f" → Low utilization: {agent} (quality)"
             self._track_selection(task, agent, "quality")
             return agent, reasoning
@@ -178,33 +238,21 @@ class ResourceAwareSelector:
         self._track_selection(task, agent, "default")
         return agent, reasoning
 
-    def _select_by_speed(self, available: List[str]) -> str:
+    def _select_by_speed(self, available: List[str], available_set: FrozenSet[str]) -> str:
         """Select fastest available agent."""
-        for agent in SPEED_RANKING:
-            if agent in available:
-                return agent
-        return available[0] if available else "claude"
+        return _first_ranked(SPEED_RANKING, available, available_set)
 
-    def _select_by_efficiency(self, available: List[str]) -> str:
+    def _select_by_efficiency(self, available: List[str], available_set: FrozenSet[str]) -> str:
         """Select most efficient available agent."""
-        for agent in EFFICIENCY_RANKING:
-            if agent in available:
-                return agent
-        return available[0] if available else "claude"
+        return _first_ranked(EFFICIENCY_RANKING, available, available_set)
 
-    def _select_by_cost(self, available: List[str]) -> str:
+    def _select_by_cost(self, available: List[str], available_set: FrozenSet[str]) -> str:
         """Select lowest cost available agent."""
-        for agent in COST_RANKING:
-            if agent in available:
-                return agent
-        return available[0] if available else "claude"
+        return _first_ranked(COST_RANKING, available, available_set)
 
-    def _select_by_quality(self, available: List[str]) -> str:
+    def _select_by_quality(self, available: List[str], available_set: FrozenSet[str]) -> str:
         """Select highest quality available agent."""
-        for agent in QUALITY_RANKING:
-            if agent in available:
-                return agent
-        return available[0] if available else "claude"
+        return _first_ranked(QUALITY_RANKING, available, available_set)
 
     def _track_selection(self, task: str, agent: str, reason: str):
         """Track selection for analysis."""
@@ -212,7 +260,7 @@ class ResourceAwareSelector:
             "task": task[:100],  # Truncate for storage
             "agent": agent,
             "reason": reason,
-            "timestamp": time.time(),
+            "timestamp": self._batch_ts if self._batch_ts is not None else time.time(),
         })
 
     def get_selection_stats(self) -> Dict[str, Dict]:
@@ -234,6 +282,48 @@ class ResourceAwareSelector:
 # CONTRACT-AWARE PROMPT BUILDING
 # ============================================================================
 
+# Fixed parts of the contract-aware prompt
+BUDGET_AWARENESS_INSTRUCTIONS = """
+## BUDGET AWARENESS INSTRUCTIONS
+
+- Monitor your resource consumption carefully
+- When utilization is high (>80%), be concise and efficient
+- Stop and report completion if running low on budget
+- Do NOT exceed the specified resource limits
+
+"""
+
+RESOURCE_CONSTRAINT_WARNING = """
+
+## ⚠️ RESOURCE CONSTRAINT ACTIVE
+
+You are running low on resources. Please:
+- Be concise and direct
+- Avoid unnecessary explanations
+- Focus on core deliverables
+- Report completion early rather than late
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _budget_header(mode: ContractMode) -> str:
+    """Opening of the budget section; it only varies by contract mode."""
+    return (
+        f"\n\n## RESOURCE BUDGET (Contract Mode: {mode.value.upper()})\n\n"
+        "You are operating under a resource contract with the following constraints:\n"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _agent_section(agent: str) -> str:
+    """AGENT CONTEXT block for a registered agent; registry configs are static."""
+    config = AGENT_REGISTRY[agent]
+    return (
+        f"\n\n## AGENT CONTEXT\nYou are running as: {config.name}\n"
+        f"Your primary strengths: {', '.join(c.value for c in config.capabilities)}\n"
+    )
+
+
 def build_contract_aware_prompt(
     base_prompt: str,
     agent: str,
@@ -256,64 +346,36 @@ def build_contract_aware_prompt(
     if not contract:
         return base_prompt
 
-    config = AGENT_REGISTRY.get(agent)
-    if not config:
+    if agent not in AGENT_REGISTRY:
         return base_prompt
 
     # Get contract status
     status = contract.get_status()
     max_util = status["max_utilization"]
 
-    # Build budget awareness section
-    budget_section = f"""
-
-## RESOURCE BUDGET (Contract Mode: {contract.mode.value.upper()})
-
-You are operating under a resource contract with the following constraints:
-"""
+    # Sections are collected and joined once; only the numbers are formatted
+    parts = [_budget_header(contract.mode)]
 
     for resource, utilization in status["utilization"].items():
         budget = status["budgets"].get(resource, float('inf'))
         if budget != float('inf'):
             consumed = status["consumption"][resource]
-            budget_section += f"- {resource.upper()}: {consumed:.0f} / {budget:.0f} ({utilization*100:.1f}%)\\n"
-
-    budget_section += f"""
-Time Remaining: {status['time_remaining']:.0f} seconds
-Overall Utilization: {max_util*100:.1f}%
-
-## BUDGET AWARENESS INSTRUCTIONS
+            parts.append(f"- {resource.upper()}: {consumed:.0f} / {budget:.0f} ({utilization*100:.1f}%)\n")
 
-- Monitor your resource consumption carefully
-- When utilization is high (>80%), be concise and efficient
-- Stop and report completion if running low on budget
-- Do NOT exceed the specified resource limits
-
-"""
+    parts.append(f"\nTime Remaining: {status['time_remaining']:.0f} seconds\n")
+    parts.append(f"Overall Utilization: {max_util*100:.1f}%\n")
+    parts.append(BUDGET_AWARENESS_INSTRUCTIONS)
 
     # Add agent-specific instructions
-    agent_section = f"""
-
-## AGENT CONTEXT
-You are running as: {config.name}
-Your primary strengths: {', '.join(c.value for c in config.capabilities)}
-"""
+    parts.append(_agent_section(agent))
 
     # Add urgency warning if needed
-    urgency_section = ""
     if max_util > 0.8 or status["time_remaining"] < 60:
-        urgency_section = """
-
-## ⚠️ RESOURCE CONSTRAINT ACTIVE
+        parts.append(RESOURCE_CONSTRAINT_WARNING)
 
-You are running low on resources. Please:
-- Be concise and direct
-- Avoid unnecessary explanations
-- Focus on core deliverables
-- Report completion early rather than late
-"""
-
-    return budget_section + agent_section + urgency_section + "\n" + base_prompt
+    parts.append("\n")
+    parts.append(base_prompt)
+    return "".join(parts)
 
 
 # ============================================================================
@@ -343,8 +405,8 @@ def optimize_agent_batch(
 
     assignment = {}
 
-    for task in tasks:
-        agent, _ = selector.select_agent(task, available_agents)
+    selections = selector.select_agent_batch(tasks, available_agents)
+    for task, (agent, _) in zip(tasks, selections):
         assignment[task] = agent
 
     return assignment
@@ -366,12 +428,14 @@ def group_tasks_by_agent(
     Returns:
         Dictionary mapping agent → list of tasks
     """
-    assignment = optimize_agent_batch(tasks, available_agents, contract)
+    selector = ResourceAwareSelector(contract)
+    selections = selector.select_agent_batch(tasks, available_agents)
 
     grouped: Dict[str, List[str]] = {agent: [] for agent in available_agents}
 
-    for task, agent in assignment.items():
-        grouped[agent].append(task)
+    # Bucket each task as it is selected; no task → agent mapping in between
+    for task, (agent, _) in zip(tasks, selections):
+        grouped.setdefault(agent, []).append(task)
 
     return grouped
 
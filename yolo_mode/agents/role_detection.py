@@ -5,6 +5,7 @@ Enhanced task-to-role mapping with comprehensive keyword detection,
 scoring algorithms, and agent selection logic.
 """
 
+import functools
 from typing import Dict, List, Tuple, Optional
 from .registry import OSARole, AGENT_REGISTRY, get_agent_for_role, AgentCapability
 
@@ -85,6 +86,15 @@ ROLE_KEYWORDS: Dict[OSARole, List[str]] = {
 }
 
 
+# (role, ((keyword, weight), ...)) in ROLE_KEYWORDS order, computed once so
+# detect_role() doesn't re-split every keyword on every call. Multi-word
+# keywords weigh more; duplicated keywords keep counting once per entry.
+_ROLE_KEYWORD_WEIGHTS: Tuple[Tuple[OSARole, Tuple[Tuple[str, float], ...]], ...] = tuple(
+    (role, tuple((keyword, len(keyword.split()) * 1.5) for keyword in keywords))
+    for role, keywords in ROLE_KEYWORDS.items()
+)
+
+
 # Capability-to-role mapping for specialized routing
 CAPABILITY_ROLE_MAP: Dict[AgentCapability, OSARole] = {
     AgentCapability.CODE_GENERATION: OSARole.CODER,
@@ -101,6 +111,18 @@ CAPABILITY_ROLE_MAP: Dict[AgentCapability, OSARole] = {
 }
 
 
+# Task keywords per capability, for detect_capability
+CAPABILITY_KEYWORDS: Dict[AgentCapability, List[str]] = {
+    AgentCapability.CODE_GENERATION: ["implement", "write", "create", "build", "function"],
+    AgentCapability.REFACTORING: ["refactor", "clean up", "improve", "optimize", "restructure"],
+    AgentCapability.TESTING: ["test", "spec", "coverage", "pytest", "verify"],
+    AgentCapability.ARCHITECTURE_DESIGN: ["architecture", "design", "schema", "structure", "pattern"],
+    AgentCapability.PLANNING: ["plan", "roadmap", "schedule", "breakdown", "decompose"],
+    AgentCapability.SECURITY_AUDIT: ["security", "audit", "vulnerability", "sanitize"],
+    AgentCapability.CODE_REVIEW: ["review", "check", "inspect", "analyze code"],
+}
+
+
 # Task complexity indicators
 COMPLEXITY_KEYWORDS = {
     "high": ["architecture", "system", "framework", "complete", "full", "entire"],
@@ -113,6 +135,36 @@ COMPLEXITY_KEYWORDS = {
 # ROLE DETECTION FUNCTIONS
 # ============================================================================
 
+# Detection results are memoized per task description: retried and
+# re-planned tasks repeat descriptions, and the keyword tables are static.
+DETECTION_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _score_roles(task_description: str) -> Tuple[Tuple[OSARole, float, int], ...]:
+    """
+    Score a task against every role's keywords in one scan.
+
+    Returns (role, weighted score, keyword matches) for each role with at
+    least one match, in ROLE_KEYWORDS order. Shared by detect_role and
+    detect_role_with_confidence so a description is only scanned once.
+    """
+    task_lower = task_description.lower()
+
+    scores = []
+    for role, weighted_keywords in _ROLE_KEYWORD_WEIGHTS:
+        score = 0.0
+        matches = 0
+        for keyword, weight in weighted_keywords:
+            if keyword in task_lower:
+                score += weight
+                matches += 1
+        if matches:
+            scores.append((role, score, matches))
+    return tuple(scores)
+
+
+@functools.lru_cache(maxsize=DETECTION_CACHE_SIZE)
 def detect_role(task_description: str) -> OSARole:
     """
     Detect the appropriate OSA role for a task.
@@ -128,34 +180,14 @@ def detect_role(task_description: str) -> OSARole:
     Returns:
         The detected OSA role
     """
-    task_lower = task_description.lower()
-
-    # Score each role by keyword matches
-    role_scores: Dict[OSARole, float] = {}
-    role_matches: Dict[OSARole, List[str]] = {}
-
-    for role, keywords in ROLE_KEYWORDS.items():
-        matches = []
-        score = 0.0
-
-        for keyword in keywords:
-            if keyword in task_lower:
-                matches.append(keyword)
-                # Weight multi-word matches higher
-                weight = len(keyword.split()) * 1.5
-                score += weight
-
-        if matches:
-            role_scores[role] = score
-            role_matches[role] = matches
+    # Roles scored by keyword matches, multi-word matches weighted higher
+    role_scores = _score_roles(task_description)
 
     if not role_scores:
         return OSARole.CODER  # Default fallback
 
-    # Get highest scoring role
-    detected_role = max(role_scores, key=role_scores.get)
-
-    return detected_role
+    # Get highest scoring role; ties go to the earlier role
+    return max(role_scores, key=lambda entry: entry[1])[0]
 
 
 def detect_role_and_agent(
@@ -189,28 +221,21 @@ def detect_role_with_confidence(
     Returns:
         Tuple of (OSA role, confidence score 0-1)
     """
-    task_lower = task_description.lower()
-
-    role_scores: Dict[OSARole, float] = {}
-    total_keywords = 0
-
-    for role, keywords in ROLE_KEYWORDS.items():
-        matches = sum(1 for kw in keywords if kw in task_lower)
-        if matches > 0:
-            role_scores[role] = matches
-            total_keywords += matches
+    # Confidence counts keyword matches, unweighted
+    role_scores = _score_roles(task_description)
 
     if not role_scores:
         return OSARole.CODER, 0.0
 
     # Calculate confidence as ratio of top score to total
-    max_score = max(role_scores.values())
-    confidence = max_score / total_keywords if total_keywords > 0 else 0.0
+    total_keywords = sum(matches for _, _, matches in role_scores)
+    detected_role, _, max_score = max(role_scores, key=lambda entry: entry[2])
+    confidence = max_score / total_keywords
 
-    detected_role = max(role_scores, key=role_scores.get)
     return detected_role, min(confidence, 1.0)
 
 
+@functools.lru_cache(maxsize=DETECTION_CACHE_SIZE)
 def detect_capability(task_description: str) -> Optional[AgentCapability]:
     """
     Detect the primary capability needed for a task.
@@ -223,21 +248,10 @@ def detect_capability(task_description: str) -> Optional[AgentCapability]:
     """
     task_lower = task_description.lower()
 
-    # Map task keywords to capabilities
-    capability_keywords = {
-        AgentCapability.CODE_GENERATION: ["implement", "write", "create", "build", "function"],
-        AgentCapability.REFACTORING: ["refactor", "clean up", "improve", "optimize", "restructure"],
-        AgentCapability.TESTING: ["test", "spec", "coverage", "pytest", "verify"],
-        AgentCapability.ARCHITECTURE_DESIGN: ["architecture", "design", "schema", "structure", "pattern"],
-        AgentCapability.PLANNING: ["plan", "roadmap", "schedule", "breakdown", "decompose"],
-        AgentCapability.SECURITY_AUDIT: ["security", "audit", "vulnerability", "sanitize"],
-        AgentCapability.CODE_REVIEW: ["review", "check", "inspect", "analyze code"],
-    }
-
     best_capability = None
     best_score = 0
 
-    for capability, keywords in capability_keywords.items():
+    for capability, keywords in CAPABILITY_KEYWORDS.items():
         score = sum(1 for kw in keywords if kw in task_lower)
         if score > best_score:
             best_score = score
@@ -246,6 +260,7 @@ def detect_capability(task_description: str) -> Optional[AgentCapability]:
     return best_capability
 
 
+@functools.lru_cache(maxsize=DETECTION_CACHE_SIZE)
 def detect_task_complexity(task_description: str) -> str:
     """
     Detect the complexity level of a task.
@@ -258,19 +273,18 @@ def detect_task_complexity(task_description: str) -> str:
     """
     task_lower = task_description.lower()
 
-    # Check for complexity indicators
-    high_score = sum(1 for kw in COMPLEXITY_KEYWORDS["high"] if kw in task_lower)
-    medium_score = sum(1 for kw in COMPLEXITY_KEYWORDS["medium"] if kw in task_lower)
-    low_score = sum(1 for kw in COMPLEXITY_KEYWORDS["low"] if kw in task_lower)
+    # The first level with any indicator wins, so stop at the first hit
+    for level in ("high", "medium", "low"):
+        if any(kw in task_lower for kw in COMPLEXITY_KEYWORDS[level]):
+            return level
 
-    if high_score > 0:
-        return "high"
-    elif medium_score > 0:
-        return "medium"
-    elif low_score > 0:
-        return "low"
-    else:
-        return "medium"  # Default
+    return "medium"  # Default
+
+
+def clear_detection_caches():
+    """Clear the memoized role, capability and complexity detections."""
+    for detect in (_score_roles, detect_role, detect_capability, detect_task_complexity):
+        detect.cache_clear()
 
 
 # ============================================================================
@@ -345,9 +359,14 @@ def detect_roles_for_batch(tasks: List[str]) -> List[Tuple[str, OSARole, str]]:
     Returns:
         List of (task, role, recommended_agent) tuples
     """
+    # Every task with the same role gets the same agent; look it up once per role
+    agent_for_role: Dict[OSARole, str] = {}
     results = []
     for task in tasks:
-        role, agent = detect_role_and_agent(task)
+        role = detect_role(task)
+        agent = agent_for_role.get(role)
+        if agent is None:
+            agent = agent_for_role[role] = get_agent_for_role(role)
         results.append((task, role, agent))
     return results
 
@@ -375,6 +375,46 @@ class AgentContract:
         self.T.start_time = time.time()
         return True
 
+    def reset(self, budgets: Optional[Dict[ResourceDimension, float]] = None) -> bool:
+        """
+        Zero resource consumption and re-activate the contract.
+
+        Mode and parent are kept, so a finished child contract can be
+        handed to the next task instead of building a new one.
+        Violated, terminated or expired contracts are not revived.
+
+        Args:
+            budgets: New budgets to apply before re-activating; infinite
+                entries are skipped, as in create_child_contract
+
+        Returns:
+            True if re-activation successful
+        """
+        with self._lock:
+            if self.state in (ContractState.VIOLATED, ContractState.TERMINATED, ContractState.EXPIRED):
+                return False
+            for r in self._resource_consumption:
+                self._resource_consumption[r] = 0.0
+            for resource, budget in (budgets or {}).items():
+                if budget != float('inf'):
+                    self.R.set_budget(resource, budget)
+            self._state_history.clear()
+            self.state = ContractState.DRAFTED
+        return self.activate()
+
+    def drain_consumption(self) -> Dict[ResourceDimension, float]:
+        """
+        Zero resource consumption and return what had been consumed.
+
+        Returns:
+            Consumption per resource, read and cleared under one lock
+        """
+        with self._lock:
+            drained = dict(self._resource_consumption)
+            for r in self._resource_consumption:
+                self._resource_consumption[r] = 0.0
+        return drained
+
     def _set_state(self, new_state: ContractState):
         """Thread-safe state transition with history tracking."""
         with self._lock:
@@ -400,7 +440,9 @@ class AgentContract:
             budget = self.R.get_budget(resource)
 
             if current + amount > budget:
-                self._set_state(ContractState.VIOLATED)
+                # Already holding _lock, so record the transition inline
+                self.state = ContractState.VIOLATED
+                self._state_history.append((time.time(), ContractState.VIOLATED))
                 return False
 
             self._resource_consumption[resource] = current + amount
@@ -686,6 +728,9 @@ class ConservationEnforcer:
         self.child_contracts: List[AgentContract] = []
         self._lock = threading.Lock()
 
+        # Released child consumption the root refused (over its budget)
+        self._unabsorbed: Dict[ResourceDimension, float] = {r: 0.0 for r in ResourceDimension}
+
     def allocate_child_budget(
         self,
         allocation_strategy: str = "equal",
@@ -709,9 +754,12 @@ class ConservationEnforcer:
                 total_budget[resource] = float('inf')
                 continue
 
+            # Split what the root has left; released children count as spent
+            remaining = max(0.0, parent_budget - self.root.get_consumption(resource))
+
             # Reserve buffer for coordination overhead
-            reserved = parent_budget * reserve_buffer
-            available = parent_budget - reserved
+            reserved = remaining * reserve_buffer
+            available = remaining - reserved
 
             if allocation_strategy == "equal":
                 # Divide equally among potential children
@@ -747,7 +795,7 @@ class ConservationEnforcer:
 
         child = AgentContract(
             mode=mode,
-            parent=self.root
+            parent_contract=self.root
         )
 
         # Apply allocated budgets
@@ -760,6 +808,29 @@ class ConservationEnforcer:
 
         return child
 
+    def release_child(self, child: AgentContract) -> bool:
+        """
+        Fold a finished child's consumption into the root contract.
+
+        The child's counters are zeroed, so verify_conservation still
+        counts the work once and the root's utilization reflects it.
+        Anything the root refuses is kept aside and still counted.
+
+        Args:
+            child: A child contract whose task has finished
+
+        Returns:
+            True if the root took all of the child's consumption
+        """
+        released = True
+        for resource, amount in child.drain_consumption().items():
+            if amount and not self.root.consume_resource(resource, amount):
+                with self._lock:
+                    self._unabsorbed[resource] += amount
+                released = False
+
+        return released
+
     def verify_conservation(self) -> bool:
         """
         Verify that all child contracts respect conservation laws.
@@ -774,9 +845,10 @@ class ConservationEnforcer:
             for resource in ResourceDimension:
                 total_consumption[resource] += child.get_consumption(resource)
 
-        # Add root's own consumption
+        # Add root's own consumption, and released usage it refused
         for resource in ResourceDimension:
             total_consumption[resource] += self.root.get_consumption(resource)
+            total_consumption[resource] += self._unabsorbed[resource]
 
         # Verify against root budgets
         for resource, total in total_consumption.items():
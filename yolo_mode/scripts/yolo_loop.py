@@ -11,12 +11,18 @@ Implements the OSA (Orchestrated System of Agents) Framework with:
 - Resource budget enforcement (NEW)
 """
 import argparse
+import functools
+import json
 import subprocess
+import tempfile
 import os
 import sys
 import re
+import selectors
 import time
 import threading
+import queue
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, List, Tuple, Set
 from dataclasses import dataclass, field
@@ -40,6 +46,16 @@ except ImportError as e:
     print("   Falling back to legacy agent handling...")
     NEW_AGENTS_AVAILABLE = False
 
+# Plan checklist patterns, compiled once instead of on every loop iteration.
+# "- [ ] something" at the start of a line, anchored so that task text which
+# itself mentions "- [ ]" isn't parsed as a second item. Whitespace classes are
+# [ \t] and the description is [^\n]*, so a match never runs into the next line.
+_PENDING_RE = re.compile(r"^[ \t]*-[ \t]*\[[ \t]*\][ \t]*([^\n]*)", re.MULTILINE)
+# A pending or completed item, matched against a single line.
+_PLAN_ITEM_RE = re.compile(r'^-\s*\[([ x])\]\s*(.+)')
+# A checked-off item, with the same whitespace tolerance as _PENDING_RE.
+_DONE_RE = re.compile(r"^[ \t]*-[ \t]*\[[xX]\][ \t]*([^\n]*)")
+
 
 # ============================================================================
 # OSA FRAMEWORK - ROLE DEFINITIONS
@@ -194,11 +210,15 @@ class ParallelExecutor:
             List of Task objects with dependencies
         """
         tasks = []
-        lines = plan_content.split('\n')
+        lines = plan_content.splitlines()
 
         for idx, line in enumerate(lines):
+            # Cheap prefilter: only checklist lines can match, and most
+            # plan lines are headings, prose or blank.
+            if not line.startswith("-"):
+                continue
             # Match "- [ ] Task description" or "- [x] Task description"
-            match = re.match(r'^-\s*\[([ x])\]\s*(.+)', line)
+            match = _PLAN_ITEM_RE.match(line)
             if match:
                 status_char, description = match.groups()
                 is_completed = status_char == 'x'
@@ -291,7 +311,7 @@ class ParallelExecutor:
             task: The task to execute
             goal: Overall goal
             plan_file: Path to plan file
-            plan_content: Current plan content
+            plan_content: Current plan content (workers read plan_file themselves)
             default_agent: Default agent to use
             use_tts: Whether TTS is enabled
 
@@ -308,7 +328,6 @@ class ParallelExecutor:
             role=detected_role,
             task=task.description,
             goal=goal,
-            plan_content=plan_content,
             plan_file=plan_file
         )
 
@@ -362,8 +381,7 @@ class ParallelExecutor:
                 )
 
                 if new_content != content:
-                    with open(plan_file, 'w') as f:
-                        f.write(new_content)
+                    write_plan(plan_file, new_content)
                     print(f"      ✅ Marked complete: {task_description[:40]}...")
 
             except Exception as e:
@@ -493,15 +511,41 @@ def get_agent_for_role(role: str, default_agent: str) -> str:
     return default_agent
 
 
-def build_role_based_prompt(role: str, task: str, goal: str, plan_content: str, plan_file: str) -> str:
+@functools.lru_cache(maxsize=32)
+def _role_prompt_head(role: str, goal: str, plan_file: str) -> str:
+    """
+    Render the part of a role prompt that doesn't depend on the task.
+
+    Every task routed to the same role for a goal reuses the same head
+    instead of re-rendering it.
+    """
+    role_obj = OSA_ROLES.get(role, OSA_ROLES["coder"])
+
+    return f"""# OSA Framework - {role_obj.name.upper()} Role
+
+{role_obj.system_prompt}
+
+## Context
+Overall Goal: {goal}
+
+## Current Plan Status
+Read '{plan_file}' to see the current plan status.
+
+"""
+
+
+def build_role_based_prompt(role: str, task: str, goal: str, plan_file: str) -> str:
     """
     Build a specialized prompt based on the detected role.
 
+    The plan is referenced by path rather than inlined: the agent can read
+    it with its own tools, and the prompt stays the same size however long
+    the plan grows.
+
     Args:
         role: The OSA role name
         task: The current task description
         goal: The overall goal
-        plan_content: Current plan file content
         plan_file: Path to the plan file
 
     Returns:
@@ -509,19 +553,7 @@ def build_role_based_prompt(role: str, task: str, goal: str, plan_content: str,
     """
     role_obj = OSA_ROLES.get(role, OSA_ROLES["coder"])
 
-    prompt = f"""# OSA Framework - {role_obj.name.upper()} Role
-
-{role_obj.system_prompt}
-
-## Context
-Overall Goal: {goal}
-
-## Current Plan Status
-```
-{plan_content[:2000]}  # Truncate to avoid token overflow
-```
-
-## YOUR CURRENT TASK
+    prompt = _role_prompt_head(role, goal, plan_file) + f"""## YOUR CURRENT TASK
 {task}
 
 ## Instructions
@@ -529,6 +561,10 @@ Overall Goal: {goal}
 2. Follow the {role_obj.name} guidelines specified above
 3. AFTER successful completion, edit '{plan_file}' to mark this task as '[x]'
 4. Do NOT ask for permission. Make reasonable assumptions if needed.
+5. Other workers may be executing other tasks from this plan at the same time.
+   Re-read '{plan_file}' right before editing it, and change only the line for YOUR task.
+   Prefer writing the updated plan to a temp file and renaming it over '{plan_file}',
+   so nobody ever reads a half-written plan.
 
 ## Reference
 See .claude/OSA_FRAMEWORK.md for OSA Framework details.
@@ -537,14 +573,15 @@ See .claude/OSA_FRAMEWORK.md for OSA Framework details.
     return prompt
 
 
-def speak(text, enabled=False):
-    """Speaks the text using tts-cli if enabled, with a BLOCKING pause to prevent overlap."""
-    if enabled:
-        try:
-            # Shorten very long texts for TTS
-            if len(text) > 100:
-                text = text[:97] + "..."
+# Announcements are played by one background thread, in order, so the loop
+# never waits on tts-cli. Started on first use.
+_speech_queue: Optional["queue.Queue[Optional[str]]"] = None
+_speech_thread: Optional[threading.Thread] = None
 
+def _speech_worker(speech_queue):
+    """Plays queued announcements one at a time until it receives None."""
+    for text in iter(speech_queue.get, None):
+        try:
             # Suppress output from tts-cli to avoid cluttering logs
             subprocess.run(["tts-cli", "--text", text], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
             # Add a small buffer after the command finishes to separate thoughts
@@ -553,8 +590,215 @@ def speak(text, enabled=False):
             # Silently fail or log to stderr if absolutely needed, but keep main output clean
             pass
 
-def run_agent(agent, prompt, verbose=False):
-    """Runs the specified agent in autonomous mode."""
+def speak(text, enabled=False):
+    """Queues the text for tts-cli if enabled. Announcements never overlap."""
+    global _speech_queue, _speech_thread
+    if not enabled:
+        return
+
+    # Shorten very long texts for TTS
+    if len(text) > 100:
+        text = text[:97] + "..."
+
+    if _speech_thread is None:
+        _speech_queue = queue.Queue()
+        _speech_thread = threading.Thread(target=_speech_worker, args=(_speech_queue,), daemon=True)
+        _speech_thread.start()
+    _speech_queue.put_nowait(text)
+
+def finish_speech():
+    """Blocks until every queued announcement has been spoken."""
+    global _speech_queue, _speech_thread
+    if _speech_thread is None:
+        return
+    _speech_queue.put(None)
+    _speech_thread.join()
+    _speech_queue = _speech_thread = None
+
+class ClaudeWorker:
+    """Serves claude prompts from pre-started `claude` processes.
+
+    Spawning `claude -p` when a task starts makes the task wait for process
+    startup and client init. Instead the worker keeps one standby process
+    already running in stream-json mode. Each prompt goes to the standby as a
+    single JSON line on stdin, and a replacement standby is started at once, so
+    its startup overlaps the current turn. The CLI answers with a stream of JSON
+    lines, terminated by a `{"type": "result", ...}` event.
+
+    Every prompt gets its own process, and so its own conversation. Context from
+    earlier tasks does not carry over, and token cost does not grow per task.
+    stdout is drained through a selector with a per-turn deadline. A process
+    that produces no result in time is killed, and the next prompt goes to a
+    fresh standby.
+    """
+
+    CMD = [
+        "claude",
+        "-p",
+        "--input-format", "stream-json",
+        "--output-format", "stream-json",
+        "--verbose",  # required by the CLI for stream-json output in print mode
+        "--dangerously-skip-permissions",
+        "--no-session-persistence",
+    ]
+
+    # Upper bound for a single turn (one plan task) before the process is
+    # treated as hung.
+    TURN_TIMEOUT = 30 * 60
+
+    def __init__(self, turn_timeout=TURN_TIMEOUT):
+        self.turn_timeout = turn_timeout
+        self.standby = None
+
+    def _spawn(self):
+        # stderr is inherited so CLI errors reach the terminal without
+        # risking a deadlock on an undrained pipe.
+        proc = subprocess.Popen(
+            self.CMD,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        # Read through the raw fd (see _read_result), never the buffered reader.
+        os.set_blocking(proc.stdout.fileno(), False)
+        return proc
+
+    def _take(self):
+        """Returns a ready process and starts its replacement in the background."""
+        proc = self.standby
+        if proc is not None and proc.poll() is not None:
+            self._stop(proc, grace=0)  # died while idle
+            proc = None
+        if proc is None:
+            proc = self._spawn()
+        try:
+            self.standby = self._spawn()
+        except OSError:
+            self.standby = None  # retried on the next prompt
+        return proc
+
+    def run(self, prompt, verbose=False):
+        """Sends one prompt and waits for its result. Returns None on failure."""
+        if verbose:
+            print(f"[{time.strftime('%H:%M:%S')}] Running claude task...")
+
+        try:
+            proc = self._take()
+        except FileNotFoundError:
+            print("❌ Agent 'claude' not found in PATH.")
+            return None
+
+        try:
+            message = {"type": "user", "message": {"role": "user", "content": prompt}}
+            proc.stdin.write((json.dumps(message) + "\n").encode())
+            # One prompt per process: EOF lets the CLI exit after this turn.
+            proc.stdin.close()
+        except BrokenPipeError:
+            print("Error running claude: worker process exited unexpectedly")
+            self._stop(proc)
+            return None
+
+        try:
+            event = self._read_result(proc, time.monotonic() + self.turn_timeout)
+        except TimeoutError:
+            print(f"Error running claude: no result after {self.turn_timeout}s, killing worker")
+            self._stop(proc, grace=0)
+            return None
+
+        self._stop(proc)
+        if event is None:
+            # stdout hit EOF before a result event: the process died mid-turn.
+            print(f"Error running claude: worker exited with code {proc.returncode}")
+            return None
+        if event.get("is_error"):
+            print(f"Error running claude: {event.get('result') or event.get('subtype')}")
+            return None
+        output = event.get("result") or ""
+        if verbose:
+            print(f"Output: {output.strip()}")
+        return output
+
+    @staticmethod
+    def _read_result(proc, deadline):
+        """Drains proc's stdout until a result event, EOF (None) or the deadline."""
+        fd = proc.stdout.fileno()
+        buf = b""
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError
+                if not selector.select(remaining):
+                    continue
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    return None
+                *lines, buf = (buf + chunk).split(b"\n")
+                for line in lines:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # ignore any non-protocol output
+                    if isinstance(event, dict) and event.get("type") == "result":
+                        return event
+
+    @staticmethod
+    def _stop(proc, grace=10):
+        """Waits up to `grace` seconds for proc to exit, then kills it."""
+        for stream in (proc.stdin, proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        try:
+            proc.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def close(self):
+        """Shuts down the idle standby process, if any."""
+        if self.standby is None:
+            return
+        # It never received a prompt, so there is no work to let finish.
+        self.standby.kill()
+        self._stop(self.standby, grace=0)
+        self.standby = None
+
+def stream_command(cmd, env=None, verbose=False):
+    """Runs cmd, collecting its stdout line by line as the agent writes it.
+
+    With verbose, each line is echoed as soon as it arrives rather than after
+    the agent exits. stderr goes to a temporary file instead of a pipe, so a
+    chatty agent can't fill an undrained stderr pipe and stall while stdout is
+    being read. Returns (returncode, stdout, stderr).
+    """
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True, env=env)
+        lines = []
+        with proc.stdout:
+            for line in proc.stdout:
+                if verbose:
+                    if not lines:
+                        print("Output:")
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+                lines.append(line)
+        returncode = proc.wait()
+        stderr_file.seek(0)
+        return returncode, "".join(lines), stderr_file.read()
+
+def run_agent(agent, prompt, verbose=False, claude_worker=None):
+    """Runs the specified agent in autonomous mode.
+
+    When `claude_worker` is given, claude prompts are served by its pre-started
+    processes instead of spawning one on demand.
+    """
+    if agent == "claude" and claude_worker is not None:
+        return claude_worker.run(prompt, verbose)
 
     cmd = []
 
@@ -591,22 +835,19 @@ def run_agent(agent, prompt, verbose=False):
     if verbose:
         print(f"[{time.strftime('%H:%M:%S')}] Running {agent} task...")
     
-    # We run capturing output to avoid cluttering the main terminal too much,
-    # but we print it if verbose.
+    # Output is streamed rather than buffered until exit; it's only echoed to
+    # the terminal if verbose.
     try:
         # Pass env_vars if they exist, otherwise default to os.environ
         run_env = locals().get('env_vars', None)
         
-        result = subprocess.run(cmd, capture_output=True, text=True, env=run_env)
+        returncode, stdout, stderr = stream_command(cmd, env=run_env, verbose=verbose)
         
-        if result.returncode != 0:
-            print(f"Error running {agent}: {result.stderr}")
+        if returncode != 0:
+            print(f"Error running {agent}: {stderr}")
             return None
-        
-        if verbose:
-            print(f"Output: {result.stdout.strip()}")
             
-        return result.stdout
+        return stdout
     except FileNotFoundError:
         print(f"❌ Agent '{agent}' not found in PATH.")
         return None
@@ -615,6 +856,226 @@ def clean_text_for_tts(text):
     """Removes markdown and other noise for clearer speech."""
     return text.replace('`', '').replace('*', '').replace('#', '').strip()
 
+def read_plan(plan_file):
+    """Returns the plan file's content, or None if it doesn't exist."""
+    try:
+        with open(plan_file, "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def write_plan(plan_file, content):
+    """Atomically replaces the plan file's content.
+
+    The new content is written to a temp file next to the plan and renamed
+    over it, so a concurrent reader sees either the old plan or the new one,
+    never a truncated or half-written file.
+    """
+    plan_dir = os.path.dirname(os.path.abspath(plan_file))
+    fd, tmp_path = tempfile.mkstemp(dir=plan_dir, prefix=".yolo-plan-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        try:
+            # mkstemp creates the file 0600; keep the plan's own permissions.
+            os.chmod(tmp_path, os.stat(plan_file).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, plan_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def find_pending_tasks(plan_content):
+    """Returns (line_index, description) for every "- [ ] something" item, in plan order.
+
+    Items are keyed by line rather than by text so that two tasks with the same
+    description are tracked (and checked off) independently.
+    """
+    pending = []
+    for index, line in enumerate(plan_content.splitlines()):
+        # Most plan lines are headings, prose or blank. A C-level startswith
+        # rejects those before paying for a regex match.
+        if not line.lstrip().startswith("-"):
+            continue
+        match = _PENDING_RE.match(line)
+        if match:
+            pending.append((index, match.group(1).strip()))
+    return pending
+
+def verify_batch(batch, plan_before, plan_after):
+    """Checks which dispatched (line_index, task) items the agents marked as done.
+
+    Returns a list of (line_index, task, completed) in batch order.
+
+    In the common case the agents only flipped their own lines, so each
+    recorded line is read back directly. Otherwise, since agents may insert
+    or reword other lines and shift indexes, count how many pending items
+    with each description disappeared between the two snapshots and credit
+    that many of the dispatched items with that description. This keeps
+    duplicate descriptions independent: finishing one of two identical
+    "- [ ] Run tests" lines completes exactly one of them.
+    """
+    results = _verify_in_place(batch, plan_before, plan_after)
+    if results is not None:
+        return results
+
+    before = Counter(task for _, task in find_pending_tasks(plan_before))
+    after = Counter(task for _, task in find_pending_tasks(plan_after))
+    done = {task: before[task] - after[task] for task in before}
+
+    results = []
+    for line_index, task in batch:
+        completed = done.get(task, 0) > 0
+        if completed:
+            done[task] -= 1
+        results.append((line_index, task, completed))
+    return results
+
+def _verify_in_place(batch, plan_before, plan_after):
+    """verify_batch() fast path for plans where only dispatched lines changed.
+
+    Returns None, meaning "use the full comparison", if any other line was
+    touched or a dispatched line changed into anything but its own checked-off
+    item.
+    """
+    before_lines = plan_before.splitlines()
+    after_lines = plan_after.splitlines()
+    if len(before_lines) != len(after_lines):
+        return None
+
+    results = []
+    restored = list(after_lines)
+    for line_index, task in batch:
+        line = after_lines[line_index]
+        if line == before_lines[line_index]:
+            results.append((line_index, task, False))
+            continue
+        match = _DONE_RE.match(line)
+        if not match or match.group(1).strip() != task:
+            return None
+        results.append((line_index, task, True))
+        restored[line_index] = before_lines[line_index]
+
+    # Putting the dispatched lines back must give the old plan exactly.
+    if restored != before_lines:
+        return None
+    return results
+
+def route_task(task, agent, goal, plan_file, contract=None, resource_selector=None):
+    """Picks the role and agent for a task and builds its prompt.
+
+    Returns (role_agent, worker_prompt).
+    """
+    # Detect appropriate role for this task based on keywords
+    if NEW_AGENTS_AVAILABLE:
+        detected_role, role_agent = detect_role_and_agent(task, [agent])
+        role_name = detected_role.value
+        reasoning = f"Role: {role_name}"
+
+        # Apply resource-aware selection if contract is active
+        if resource_selector and contract:
+            role_agent, selector_reasoning = resource_selector.select_agent(task, [agent], detected_role)
+            reasoning = selector_reasoning
+    else:
+        # Legacy behavior
+        detected_role = detect_role(task)
+        role_agent = get_agent_for_role(detected_role, agent)
+        role_name = detected_role
+        reasoning = None
+
+    print(f"🔨 Executing Task: {task}")
+    print(f"   🎭 Detected Role: {role_name.upper()}")
+    if role_agent != agent:
+        print(f"   🤖 Agent: {role_agent}")
+    if reasoning:
+        print(f"   📊 {reasoning}")
+
+    # OSA_ROLES is keyed by role name, so pass the name, not the OSARole.
+    worker_prompt = build_role_based_prompt(
+        role=role_name,
+        task=task,
+        goal=goal,
+        plan_file=plan_file
+    )
+    if NEW_AGENTS_AVAILABLE:
+        # Build contract-aware prompt
+        worker_prompt = build_contract_aware_prompt(worker_prompt, role_agent, contract)
+    return role_agent, worker_prompt
+
+def track_consumption(contract, output, use_tts=False):
+    """Charges one finished task's output against the contract budgets."""
+    # Estimate token consumption based on output length
+    estimated_tokens = len(str(output)) // 4  # Rough estimate
+    contract.consume_resource(ResourceDimension.TOKENS, estimated_tokens)
+    contract.consume_resource(ResourceDimension.ITERATIONS, 1)
+
+    # Print contract status
+    status = contract.get_status()
+    max_util = status["max_utilization"]
+    if max_util > 0.8:
+        print(f"   📊 High utilization: {max_util*100:.0f}%")
+        if use_tts:
+            speak(f"Resource usage at {max_util*100:.0f} percent", True)
+
+def run_batch(batch, routes, plan_content, plan_file, claude_workers, contract=None, use_tts=False):
+    """Runs a batch of (line_index, task) items concurrently, then verifies the plan.
+
+    `routes` holds the (role_agent, worker_prompt) for each item, from
+    route_task(). Returns (results, plan_after): the verify_batch() result, one
+    (line_index, task, completed) per item, and the plan content it was checked
+    against, which the loop reuses as the next iteration's plan. plan_after is
+    None if the plan file disappeared.
+    """
+    # Workers are separate agent processes, which is where the real
+    # concurrency lives; threads just wait on them. Logging, TTS and contract
+    # accounting happen here on the main thread. A batch of one streams its
+    # output live as before; larger batches print each task's output when it
+    # finishes so they don't interleave.
+    solo = len(batch) == 1
+    with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+        futures = {}
+        for slot, ((_, task), (role_agent, prompt)) in enumerate(zip(batch, routes)):
+            if not solo:
+                print(f"[{time.strftime('%H:%M:%S')}] Running {role_agent} task: {task}")
+            future = pool.submit(run_agent, role_agent, prompt, verbose=solo,
+                                 claude_worker=claude_workers[slot % len(claude_workers)])
+            futures[future] = task
+
+        for future in as_completed(futures):
+            task = futures[future]
+            output = future.result()
+            if output is None:
+                if use_tts:
+                    speak(f"Error executing task: {clean_text_for_tts(task)}", True)
+                continue
+            if not solo:
+                print(f"Output ({task}): {output.strip()}")
+            # Track resource consumption after execution
+            if contract:
+                track_consumption(contract, output, use_tts)
+
+    # Verification: re-read the plan once, after every worker has exited. A
+    # task only counts as done if its agent checked it off; a worker that
+    # exited cleanly without doing so leaves the task pending for a retry.
+    # With --max-workers > 1 two agents can race on the same file and one
+    # check-off may be lost; that task then simply reruns next iteration.
+    plan_after = read_plan(plan_file)
+    if plan_after is None:
+        # Deleted while the batch ran; the loop reports it and stops.
+        return [(line_index, task, False) for line_index, task in batch], None
+    results = verify_batch(batch, plan_content, plan_after)
+
+    for _, task, completed in results:
+        if completed:
+            if use_tts:
+                speak(f"Completed task: {clean_text_for_tts(task)}", True)
+        else:
+            print(f"⚠️ Warning: Plan was not updated for task: {task}")
+            if use_tts:
+                speak("Warning: Plan not updated.", True)
+    return results, plan_after
+
 def main():
     parser = argparse.ArgumentParser(description="YOLO Mode Loop")
     parser.add_argument("prompt", nargs="+", help="The main goal/prompt")
@@ -622,12 +1083,19 @@ def main():
     parser.add_argument("--agent", default="claude", help="The CLI agent to use (claude, opencode, gemini, qwen, crush, mini, etc.)")
     parser.add_argument("--contract-mode", choices=["urgent", "economical", "balanced"], default="balanced",
                         help="Contract mode for resource management (default: balanced)")
+    parser.add_argument("--max-workers", type=int, default=1,
+                        help="Max pending tasks to execute concurrently per iteration (default: 1, serial). "
+                             "Values above 1 run the next N tasks in plan order without checking dependencies "
+                             "between them, so only use it for plans whose tasks are independent.")
     args = parser.parse_args()
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
 
     goal = " ".join(args.prompt)
     use_tts = args.tts
     agent = args.agent
     contract_mode_str = args.contract_mode
+    max_workers = args.max_workers
     plan_file = "YOLO_PLAN.md"
 
     # Create contract if new agents available
@@ -647,6 +1115,23 @@ def main():
         speak(f"Starting YOLO Mode with {agent} for: {clean_goal}", True)
         time.sleep(1) # Extra pause after start
 
+    # One ClaudeWorker per concurrent slot: a worker holds a single standby
+    # process, so it can't be shared between threads. Nothing is spawned
+    # until a task is actually routed to claude.
+    claude_workers = [ClaudeWorker() for _ in range(max_workers)]
+    try:
+        _run_loop(goal, use_tts, agent, plan_file, contract, resource_selector, claude_workers, max_workers)
+    finally:
+        for claude_worker in claude_workers:
+            claude_worker.close()
+        # Let the last announcements (e.g. "Goodbye") finish before exiting.
+        finish_speech()
+
+def _run_loop(goal, use_tts, agent, plan_file, contract, resource_selector, claude_workers, max_workers):
+    """Plan -> execute -> verify loop, followed by the interactive feedback prompt."""
+    # Planning and feedback prompts run serially on the first worker.
+    claude_worker = claude_workers[0]
+
     # Ensure we are in the right directory (cwd)
     # The script is likely run from the project root.
     
@@ -671,7 +1156,7 @@ def main():
             Do not include any completed tasks yet. Just the initial plan.
             Use the available tools (Bash, Write, etc.) to create the file.
             """
-            run_agent(agent, init_prompt, verbose=True)
+            run_agent(agent, init_prompt, verbose=True, claude_worker=claude_worker)
         else:
             print(f"📋 Found existing {plan_file}, resuming...")
             if use_tts:
@@ -679,33 +1164,40 @@ def main():
 
         # Step 2: Loop
         iteration = 0
-        max_iterations = 50 # Safety limit
+        # Safety limit. Counts batches, not tasks: with --max-workers N a run
+        # can execute up to 50 * N tasks before stopping.
+        max_iterations = 50
+        # The verification read at the end of each iteration doubles as the
+        # next iteration's snapshot, so the plan is read once per iteration.
+        plan_content = None
+        # Consecutive iterations that re-ran the same batch without finishing
+        # any of it. A stuck agent would otherwise burn the whole budget.
+        stuck_count = 0
+        last_batch = None
         
         while iteration < max_iterations:
             iteration += 1
             print(f"\n🔄 Iteration {iteration}")
             
-            if not os.path.exists(plan_file):
+            # No separate exists() check: reading the plan tells us if it's gone.
+            if plan_content is None:
+                plan_content = read_plan(plan_file)
+            if plan_content is None:
                 print(f"❌ {plan_file} missing. Aborting.")
                 if use_tts:
                     speak("Error. Plan file is missing.", True)
                 break
                 
-            with open(plan_file, "r") as f:
-                plan_content = f.read()
-                
-            # Find next pending task
-            # Regex to find "- [ ] something"
-            # We look for lines starting with "- [ ]"
-            match = re.search(r"-\s*\[\s*\]\s*(.*)", plan_content)
+            # Collect every pending "- [ ] something" item and run up to
+            # max_workers of them concurrently. The agents are network-bound,
+            # so overlapping them turns per-task latency into throughput.
+            pending = find_pending_tasks(plan_content)
             
-            if not match:
+            if not pending:
                 print("✅ No more pending tasks found. Mission Complete!")
                 if use_tts:
                     speak("All tasks completed. Mission accomplished.", True)
                 break
-                
-            current_task = match.group(1).strip()
 
             # ============================================================================
             # ROLE-BASED TASK ROUTING (OSA Framework)
@@ -720,52 +1212,15 @@ def main():
                         speak(f"Contract violation: {reason}", True)
                     break
 
-            # Detect appropriate role for this task based on keywords
-            if NEW_AGENTS_AVAILABLE:
-                detected_role, role_agent = detect_role_and_agent(current_task, [agent])
-                reasoning = f"Role: {detected_role.value}"
-
-                # Apply resource-aware selection if contract is active
-                if resource_selector and contract:
-                    role_agent, selector_reasoning = resource_selector.select_agent(current_task, [agent], detected_role)
-                    reasoning = selector_reasoning
-
-                print(f"🔨 Executing Task: {current_task}")
-                print(f"   🎭 Detected Role: {detected_role.value.upper()}")
-                if role_agent != agent:
-                    print(f"   🤖 Agent: {role_agent}")
-                print(f"   📊 {reasoning}")
-
-                # Build contract-aware prompt
-                base_prompt = build_role_based_prompt(
-                    role=detected_role,
-                    task=current_task,
-                    goal=goal,
-                    plan_content=plan_content,
-                    plan_file=plan_file
-                )
-                worker_prompt = build_contract_aware_prompt(base_prompt, role_agent, contract)
-            else:
-                # Legacy behavior
-                detected_role = detect_role(current_task)
-                role_agent = get_agent_for_role(detected_role, agent)
-
-                print(f"🔨 Executing Task: {current_task}")
-                print(f"   🎭 Detected Role: {detected_role.value.upper()}")
-                if role_agent != agent:
-                    print(f"   🤖 Agent Selection: {role_agent} (role-preferred)")
-
-                worker_prompt = build_role_based_prompt(
-                    role=detected_role,
-                    task=current_task,
-                    goal=goal,
-                    plan_content=plan_content,
-                    plan_file=plan_file
-                )
+            batch = pending[:max_workers]
+            routes = [
+                route_task(task, agent, goal, plan_file, contract, resource_selector)
+                for _, task in batch
+            ]
 
             if use_tts:
-                clean_task = clean_text_for_tts(current_task)
-                speak(f"Executing: {clean_task}", True)
+                for _, task in batch:
+                    speak(f"Executing: {clean_text_for_tts(task)}", True)
 
             # Check contract status before execution
             if contract:
@@ -776,44 +1231,23 @@ def main():
                         speak(f"Contract constraint reached: {reason}", True)
                     break
 
-            # Execute with the role-appropriate agent
-            output = run_agent(role_agent, worker_prompt, verbose=True)
+            # Execute with the role-appropriate agents, then verify. None
+            # means the plan disappeared; the next iteration reports it.
+            results, plan_content = run_batch(batch, routes, plan_content, plan_file, claude_workers, contract, use_tts)
 
-            # Track resource consumption after execution
-            if contract and output:
-                # Estimate token consumption based on output length
-                estimated_tokens = len(str(output)) // 4  # Rough estimate
-                contract.consume_resource(ResourceDimension.TOKENS, estimated_tokens)
-                contract.consume_resource(ResourceDimension.ITERATIONS, 1)
-
-                # Print contract status
-                status = contract.get_status()
-                max_util = status["max_utilization"]
-                if max_util > 0.8:
-                    print(f"   📊 High utilization: {max_util*100:.0f}%")
-                    if use_tts:
-                        speak(f"Resource usage at {max_util*100:.0f} percent", True)
-            
-            if output is None:
-                 if use_tts:
-                     speak(f"Error executing task: {clean_task}", True)
-            
-            # Verification: Check if plan was updated
-            with open(plan_file, "r") as f:
-                new_content = f.read()
-                
-            if plan_content != new_content:
-                # Plan changed, assume success
-                if use_tts:
-                    speak(f"Completed task: {clean_task}", True)
+            if plan_content is not None and not any(completed for _, _, completed in results):
+                stuck_count = stuck_count + 1 if batch == last_batch else 1
             else:
-                print("⚠️ Warning: Plan was not updated.")
+                stuck_count = 0
+            last_batch = batch
+            if stuck_count >= 2:
+                print("🛑 No progress on the same task(s) for 2 iterations. Stopping.")
+                print("   Remaining tasks:")
+                for _, task in find_pending_tasks(plan_content):
+                    print(f"   - [ ] {task}")
                 if use_tts:
-                    speak("Warning: Plan not updated.", True)
-                
-                # Simple retry prevention logic could go here
-            
-            time.sleep(1) # Brief pause
+                    speak("Stuck on the current task. Stopping.", True)
+                break
 
         if iteration >= max_iterations:
             print("🛑 Max iterations reached. Stopping.")
@@ -865,7 +1299,7 @@ def main():
         Append them as new checklist items "- [ ] Task".
         Do NOT remove completed tasks.
         """
-        run_agent(agent, update_prompt, verbose=True)
+        run_agent(agent, update_prompt, verbose=True, claude_worker=claude_worker)
         # Loop continues...
 
 if __name__ == "__main__":